@@ -29,7 +29,7 @@ from ...utils.object_data import get_data_center_co_world
 from ...utils.gpu_draw import draw_bg
 from ...utils.scene import get_unit
 from ...utils.text import draw_text_block
-from ...utils.text import get_text_block_dimensions
+from ...utils.text import measure_text_block
 from ...utils.theme import get_axis_color
 from ...utils.view3d import get_non_overlap_width
 from ...utils.view3d import hide_sidebar
@@ -746,7 +746,7 @@ class RADDUPLICATOR_OT_radial_array_modal(bpy.types.Operator):
 
     def switch_radial_array(self, context, direction: str) -> None:
         """Search for next/prev radial array and switch to it if it's found."""
-        active_idx = self.master_ob_radial_arrays.value.index(self.master_radial_array)
+        active_idx = self.master_ob_radial_arrays.index(self.master_radial_array)
 
         if direction == 'PREV':
             idx = active_idx - 1
@@ -781,7 +781,8 @@ class RADDUPLICATOR_OT_radial_array_modal(bpy.types.Operator):
             props = radial_array.properties.value
             attrs = self.radial_array_initial_attrs[radial_array]
 
-            props["spin_orientation_matrix_object"] = np.array(attrs["spin_orientation_matrix_object"]).T.ravel()
+            mx = np.array(attrs["spin_orientation_matrix_object"], dtype=np.float32)
+            props["spin_orientation_matrix_object"] = mx.ravel(order='F')
             spin_orientation_enums = props.bl_rna.properties["spin_orientation"].enum_items
             props["spin_orientation"] = spin_orientation_enums.find(attrs["spin_orientation"])
             spin_axis_enums = props.bl_rna.properties["spin_axis"].enum_items
@@ -968,7 +969,7 @@ class RADDUPLICATOR_OT_radial_array_modal(bpy.types.Operator):
         radial_array_count = len(self.master_ob_radial_arrays.value)
 
         if radial_array_count > 1:
-            current_idx = self.master_ob_radial_arrays.value.index(self.master_radial_array) + 1
+            current_idx = self.master_ob_radial_arrays.index(self.master_radial_array) + 1
             name_text_lines = [[
                 (radial_array_name, main_color),
                 (f" (\u21c5)", key_color),
@@ -989,16 +990,14 @@ class RADDUPLICATOR_OT_radial_array_modal(bpy.types.Operator):
         offset_x, offset_y = 100, 100  # offset of overlay box from 3d view borders
 
         # Calculate text dimensions
-        props_text_block_width, props_text_block_height = \
-            get_text_block_dimensions(props_text_lines, line_padding, font_id, font_size, dpi)
-        name_text_block_width, name_text_block_height = \
-            get_text_block_dimensions(name_text_lines, line_padding, font_id, font_size, dpi)
+        props_text_block = measure_text_block(props_text_lines, line_padding, font_id, font_size, dpi)
+        name_text_block = measure_text_block(name_text_lines, line_padding, font_id, font_size, dpi)
 
         # Calculate text coordinates
         props_text_block_x_right = get_non_overlap_width(context) - offset_x
-        props_text_block_x_left = props_text_block_x_right - max(props_text_block_width, name_text_block_width)
+        props_text_block_x_left = props_text_block_x_right - max(props_text_block.width, name_text_block.width)
         props_text_block_y_bottom = offset_y
-        props_text_block_y_top = props_text_block_y_bottom + props_text_block_height
+        props_text_block_y_top = props_text_block_y_bottom + props_text_block.height
 
         # Draw
         draw_bg(shader_2d,
@@ -1009,17 +1008,17 @@ class RADDUPLICATOR_OT_radial_array_modal(bpy.types.Operator):
                 bg_padding,
                 bg_color)
 
-        draw_text_block(props_text_lines,
+        draw_text_block(props_text_block,
                         props_text_block_x_left,
                         props_text_block_y_top,
-                        line_padding, align, font_id, font_size, dpi)
+                        line_padding, align, font_id, font_size)
 
         if radial_array_count > 1:
             # Calculate text coordinates
             name_text_block_x_right = props_text_block_x_right
             name_text_block_x_left = props_text_block_x_left
             name_text_block_y_bottom = props_text_block_y_top + separator_height + 2 * bg_padding
-            name_text_block_y_top = name_text_block_y_bottom + name_text_block_height
+            name_text_block_y_top = name_text_block_y_bottom + name_text_block.height
 
             # Draw
             draw_bg(shader_2d,
@@ -1030,10 +1029,12 @@ class RADDUPLICATOR_OT_radial_array_modal(bpy.types.Operator):
                     bg_padding,
                     bg_color)
 
-            draw_text_block(name_text_lines,
+            # font state is left from drawing props text block
+            draw_text_block(name_text_block,
                             name_text_block_x_left,
                             name_text_block_y_top,
-                            line_padding, align, font_id, font_size, dpi)
+                            line_padding, align, font_id, font_size,
+                            set_font_state=False)
 
     def build_3d_shader_batches(self):
         """Build axis circle and angle lines shader batches."""
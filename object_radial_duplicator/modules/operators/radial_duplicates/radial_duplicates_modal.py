@@ -27,7 +27,7 @@ from ...utils.object_data import data_is_selected
 from ...utils.gpu_draw import draw_bg
 from ...utils.scene import get_unit
 from ...utils.text import draw_text_block
-from ...utils.text import get_text_block_dimensions
+from ...utils.text import measure_text_block
 from ...utils.theme import get_axis_color
 from ...utils.view3d import get_non_overlap_width
 from ...utils.view3d import hide_sidebar
@@ -815,14 +815,13 @@ class RADDUPLICATOR_OT_radial_duplicates_modal(bpy.types.Operator):
         offset_x, offset_y = 100, 100  # offset of overlay box from 3d view borders
 
         # Calculate text dimensions
-        props_text_block_width, props_text_block_height = \
-            get_text_block_dimensions(props_text_lines, line_padding, font_id, font_size, dpi)
+        props_text_block = measure_text_block(props_text_lines, line_padding, font_id, font_size, dpi)
 
         # Calculate text coordinates
         props_text_block_x_right = get_non_overlap_width(context) - offset_x
-        props_text_block_x_left = props_text_block_x_right - props_text_block_width
+        props_text_block_x_left = props_text_block_x_right - props_text_block.width
         props_text_block_y_bottom = offset_y
-        props_text_block_y_top = props_text_block_y_bottom + props_text_block_height
+        props_text_block_y_top = props_text_block_y_bottom + props_text_block.height
 
         # Draw
         draw_bg(shader_2d,
@@ -833,10 +832,10 @@ class RADDUPLICATOR_OT_radial_duplicates_modal(bpy.types.Operator):
                 bg_padding,
                 bg_color)
 
-        draw_text_block(props_text_lines,
+        draw_text_block(props_text_block,
                         props_text_block_x_left,
                         props_text_block_y_top,
-                        line_padding, align, font_id, font_size, dpi)
+                        line_padding, align, font_id, font_size)
 
     def build_3d_shader_batches(self):
         """Build axis circle and angle lines shader batches."""
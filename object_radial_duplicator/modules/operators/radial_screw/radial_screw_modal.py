@@ -29,7 +29,7 @@ from ...utils.object_data import get_data_center_co_world
 from ...utils.gpu_draw import draw_bg
 from ...utils.scene import get_unit
 from ...utils.text import draw_text_block
-from ...utils.text import get_text_block_dimensions
+from ...utils.text import measure_text_block
 from ...utils.theme import get_axis_color
 from ...utils.view3d import get_non_overlap_width
 from ...utils.view3d import hide_sidebar
@@ -759,7 +759,7 @@ class RADDUPLICATOR_OT_radial_screw_modal(bpy.types.Operator):
 
     def switch_radial_screw(self, context, direction: str) -> None:
         """Search for next/prev radial screw and switch to it if it's found."""
-        active_idx = self.master_ob_radial_screws.value.index(self.master_radial_screw)
+        active_idx = self.master_ob_radial_screws.index(self.master_radial_screw)
 
         if direction == 'PREV':
             idx = active_idx - 1
@@ -991,7 +991,7 @@ class RADDUPLICATOR_OT_radial_screw_modal(bpy.types.Operator):
         radial_screw_count = len(self.master_ob_radial_screws.value)
 
         if radial_screw_count > 1:
-            current_idx = self.master_ob_radial_screws.value.index(self.master_radial_screw) + 1
+            current_idx = self.master_ob_radial_screws.index(self.master_radial_screw) + 1
             name_text_lines = [[
                 (radial_screw_name, main_color),
                 (f" (\u21c5)", key_color),
@@ -1012,16 +1012,14 @@ class RADDUPLICATOR_OT_radial_screw_modal(bpy.types.Operator):
         offset_x, offset_y = 100, 100  # offset of overlay box from 3d view borders
 
         # Calculate text dimensions
-        props_text_block_width, props_text_block_height = \
-            get_text_block_dimensions(props_text_lines, line_padding, font_id, font_size, dpi)
-        name_text_block_width, name_text_block_height = \
-            get_text_block_dimensions(name_text_lines, line_padding, font_id, font_size, dpi)
+        props_text_block = measure_text_block(props_text_lines, line_padding, font_id, font_size, dpi)
+        name_text_block = measure_text_block(name_text_lines, line_padding, font_id, font_size, dpi)
 
         # Calculate text coordinates
         props_text_block_x_right = get_non_overlap_width(context) - offset_x
-        props_text_block_x_left = props_text_block_x_right - max(props_text_block_width, name_text_block_width)
+        props_text_block_x_left = props_text_block_x_right - max(props_text_block.width, name_text_block.width)
         props_text_block_y_bottom = offset_y
-        props_text_block_y_top = props_text_block_y_bottom + props_text_block_height
+        props_text_block_y_top = props_text_block_y_bottom + props_text_block.height
 
         # Draw
         draw_bg(shader_2d,
@@ -1032,17 +1030,17 @@ class RADDUPLICATOR_OT_radial_screw_modal(bpy.types.Operator):
                 bg_padding,
                 bg_color)
 
-        draw_text_block(props_text_lines,
+        draw_text_block(props_text_block,
                         props_text_block_x_left,
                         props_text_block_y_top,
-                        line_padding, align, font_id, font_size, dpi)
+                        line_padding, align, font_id, font_size)
 
         if radial_screw_count > 1:
             # Calculate text coordinates
             name_text_block_x_right = props_text_block_x_right
             name_text_block_x_left = props_text_block_x_left
             name_text_block_y_bottom = props_text_block_y_top + separator_height + 2 * bg_padding
-            name_text_block_y_top = name_text_block_y_bottom + name_text_block_height
+            name_text_block_y_top = name_text_block_y_bottom + name_text_block.height
 
             # Draw
             draw_bg(shader_2d,
@@ -1053,10 +1051,12 @@ class RADDUPLICATOR_OT_radial_screw_modal(bpy.types.Operator):
                     bg_padding,
                     bg_color)
 
-            draw_text_block(name_text_lines,
+            # font state is left from drawing props text block
+            draw_text_block(name_text_block,
                             name_text_block_x_left,
                             name_text_block_y_top,
-                            line_padding, align, font_id, font_size, dpi)
+                            line_padding, align, font_id, font_size,
+                            set_font_state=False)
 
     def build_3d_shader_batches(self):
         """Build axis circle and angle lines shader batches."""
@@ -5,6 +5,9 @@ from bpy.types import Object
 
 from .radial_objects.radial_array_object import ObjectRadialArrays
 from .radial_objects.radial_duplicates_object import RadialDuplicates
+from .utils.object import split_name_index
+from .radial_objects.radial_screw_builder import find_nodes_mod
+from .radial_objects.radial_screw_builder import find_screw_mod
 from .radial_objects.radial_screw_object import ObjectRadialScrews
 
 
@@ -153,10 +156,9 @@ def update_screw(self, context):
 
 def update_screw_show_viewport(self, context):
     ob = self.id_data
-    radial_screws = ObjectRadialScrews(context, ob)
-    radial_screw = radial_screws[self.name]
-    screw_modifier = radial_screw.screw_modifier.value
-    nodes_modifier = radial_screw.nodes_modifier.value
+    # Only modifiers are toggled, so find them by name instead of building all radial screws of the object.
+    screw_modifier = find_screw_mod(ob, self.name)
+    nodes_modifier = find_nodes_mod(ob, *split_name_index(self.name))
 
     if screw_modifier is not None:
         screw_modifier.show_viewport = self.show_viewport
@@ -1,4 +1,3 @@
-import re
 from typing import Optional
 
 import bpy
@@ -8,16 +7,19 @@ from bpy.types import Context
 from bpy.types import NodesModifier
 from bpy.types import NodeTree
 from bpy.types import Object
-from mathutils import Matrix
 from mathutils import Vector
 
 from .. import properties
 from ...package import get_preferences
+from ..utils.math import get_rotation_pivot_co
 from ..utils.object import copy_collections
 from ..utils.object import get_modifier_index
+from ..utils.object import split_name_index
 from ..utils.object import move_to_collection
 from ..utils.object import copy_local_view_state
 
+_SCRATCH16 = np.empty(16, dtype=np.float32)
+
 
 def find_array_mod(ob: Object, name: str) -> Optional[ArrayModifier]:
     """Find array modifier by name."""
@@ -25,14 +27,10 @@ def find_array_mod(ob: Object, name: str) -> Optional[ArrayModifier]:
     return array_mod
 
 
-def find_nodes_mod(ob: Object, name: str) -> Optional[NodesModifier]:
-    """Find nodes modifier by name."""
-    match = re.search(r"\.[0-9]+$", name)
-    index = "" if match is None else match.group(0)
-    base_name = name.removesuffix(index)
-    nodes_mods = filter(lambda mod: mod.type == 'NODES' and mod.name == f"{base_name}Offset{index}", ob.modifiers)
-    nodes_mod = next(nodes_mods, None)
-    return nodes_mod
+def find_nodes_mod(ob: Object, base_name: str, index: str) -> Optional[NodesModifier]:
+    """Find nodes modifier by base name and numeric suffix of its array modifier."""
+    nodes_mod = ob.modifiers.get(f"{base_name}Offset{index}")
+    return nodes_mod if nodes_mod is not None and nodes_mod.type == 'NODES' else None
 
 
 def find_offset_empty(array_mod: ArrayModifier) -> Optional[Object]:
@@ -68,18 +66,16 @@ def new_array_mod(context: Context, ob: Object) -> ArrayModifier:
 
 
 def new_nodes_mod(
-    ob: Object, array_mod: ArrayModifier, props: "properties.RadialArrayPropsGroup", name: str
+    ob: Object, array_mod: ArrayModifier, props: "properties.RadialArrayPropsGroup", base_name: str, index: str
 ) -> NodesModifier:
     """Add new nodes modifier to object and sort it."""
-    match = re.search(r"\.[0-9]+$", name)
-    index = "" if match is None else match.group(0)
-    base_name = array_mod.name.removesuffix(index)
     # noinspection PyTypeChecker
     nodes_mod: NodesModifier = ob.modifiers.new(name=f"{base_name}Offset{index}", type='NODES')
     nodes_mod.node_group = new_node_group()
     nodes_mod.show_expanded = False
     nodes_mod.show_viewport = props.show_viewport
-    sort_nodes_mod(ob, nodes_mod, array_mod)
+    # new modifier is always appended to the end of the stack
+    sort_nodes_mod(ob, nodes_mod, array_mod, nodes_mod_idx=len(ob.modifiers) - 1)
     return nodes_mod
 
 
@@ -123,8 +119,9 @@ def new_props(ob: Object, array_mod: ArrayModifier, name: str) -> "properties.Ra
     """Add a new radial array property group and return it."""
     props = ob.radial_duplicator.arrays.add()
     props["name"] = name
-    mx = ob.matrix_world.inverted()
-    props["spin_orientation_matrix_object"] = np.array(mx).ravel()
+    # property assignment copies the data, so the same buffer is reused for every build
+    _SCRATCH16.reshape(4, 4)[:] = ob.matrix_world.inverted()
+    props["spin_orientation_matrix_object"] = _SCRATCH16
     props["show_viewport"] = array_mod.show_viewport
     return props
 
@@ -134,9 +131,9 @@ def new_center_empty(context: Context, ob: Object, props: "properties.RadialArra
     center_empty = bpy.data.objects.new(name="RadialArrayEmpty", object_data=None)
     center_empty.empty_display_type = 'SPHERE'
     center_empty.empty_display_size = max(ob.dimensions) / 2
-    if get_preferences().move_empties_to_collection:
-        empties_collection = get_preferences().empties_collection
-        move_to_collection(empties_collection, center_empty)
+    preferences = get_preferences()
+    if preferences.move_empties_to_collection:
+        move_to_collection(preferences.empties_collection, center_empty)
     else:
         copy_collections(ob, center_empty)
         copy_local_view_state(context, center_empty)
@@ -159,9 +156,9 @@ def new_offset_empty(context: Context, ob: Object, array_mod: ArrayModifier) ->
     offset_empty = bpy.data.objects.new(name="RadialArrayEmpty", object_data=None)
     offset_empty.empty_display_type = 'SPHERE'
     offset_empty.empty_display_size = max(ob.dimensions) / 2
-    if get_preferences().move_empties_to_collection:
-        empties_collection = get_preferences().empties_collection
-        move_to_collection(empties_collection, offset_empty)
+    preferences = get_preferences()
+    if preferences.move_empties_to_collection:
+        move_to_collection(preferences.empties_collection, offset_empty)
     else:
         copy_collections(ob, offset_empty)
         copy_local_view_state(context, offset_empty)
@@ -210,17 +207,31 @@ def sort_array_mod(ob: Object, array_mod: ArrayModifier) -> None:
             else:
                 new_array_mod_idx = 0
 
-    ob.modifiers.move(from_index=array_mod_idx, to_index=new_array_mod_idx)
+    # moving tags the object for re-evaluation even when the index stays the same
+    if new_array_mod_idx != array_mod_idx:
+        ob.modifiers.move(from_index=array_mod_idx, to_index=new_array_mod_idx)
 
 
-def sort_nodes_mod(ob: Object, nodes_mod: NodesModifier, array_mod: ArrayModifier) -> None:
-    """Place nodes modifier before array modifier."""
-    nodes_mod_idx = ob.modifiers.find(nodes_mod.name)
-    array_mod_idx = ob.modifiers.find(array_mod.name)
+def sort_nodes_mod(
+    ob: Object,
+    nodes_mod: NodesModifier,
+    array_mod: ArrayModifier,
+    nodes_mod_idx: Optional[int] = None,
+    array_mod_idx: Optional[int] = None,
+) -> None:
+    """Place nodes modifier before array modifier.
+
+    Modifier indices are looked up if they aren't provided.
+    """
+    if nodes_mod_idx is None:
+        nodes_mod_idx = ob.modifiers.find(nodes_mod.name)
+    if array_mod_idx is None:
+        array_mod_idx = ob.modifiers.find(array_mod.name)
     new_nodes_mod_idx = get_modifier_index(current_index=nodes_mod_idx,
                                            reference_index=array_mod_idx,
                                            position='BEFORE')
-    ob.modifiers.move(from_index=nodes_mod_idx, to_index=new_nodes_mod_idx)
+    if new_nodes_mod_idx != nodes_mod_idx:
+        ob.modifiers.move(from_index=nodes_mod_idx, to_index=new_nodes_mod_idx)
 
 
 def restore_props(
@@ -261,9 +272,7 @@ def get_pivot_co(ob: Object, offset_empty: Object) -> Vector:
     Return one of the points lying on the spin axis.
     """
     transform_mx = offset_empty.matrix_world @ ob.matrix_world.inverted()
-    a = Matrix.Identity(3) - transform_mx.to_3x3().normalized()
-    b = transform_mx.to_translation()
-    pivot_co = Vector(np.linalg.lstsq(a, b, rcond=None)[0])
+    pivot_co = get_rotation_pivot_co(transform_mx)
     return pivot_co
 
 
@@ -290,9 +299,9 @@ def fix_center_empty(ob: Object, center_empty: Optional[Object]) -> None:
     """Set correct center empty collections."""
     if center_empty is not None:
         if not center_empty.users_collection:
-            if get_preferences().move_empties_to_collection:
-                empties_collection = get_preferences().empties_collection
-                move_to_collection(empties_collection, center_empty)
+            preferences = get_preferences()
+            if preferences.move_empties_to_collection:
+                move_to_collection(preferences.empties_collection, center_empty)
             else:
                 copy_collections(ob, center_empty)
 
@@ -301,98 +310,39 @@ def fix_offset_empty(ob: Object, offset_empty: Optional[Object]) -> None:
     """Set correct offset empty collections."""
     if offset_empty is not None:
         if not offset_empty.users_collection:
-            if get_preferences().move_empties_to_collection:
-                empties_collection = get_preferences().empties_collection
-                move_to_collection(empties_collection, offset_empty)
+            preferences = get_preferences()
+            if preferences.move_empties_to_collection:
+                move_to_collection(preferences.empties_collection, offset_empty)
             else:
                 copy_collections(ob, offset_empty)
 
 
-class ExistingRadialArrayBuilder:
-    @staticmethod
-    def get_array_mod(ob: Object, name: str) -> Optional[ArrayModifier]:
-        return find_array_mod(ob, name)
-
-    @staticmethod
-    def get_name(array_mod: Optional[ArrayModifier]) -> str:
-        return "" if array_mod is None else array_mod.name
-
-    @staticmethod
-    def get_offset_empty(array_mod: Optional[ArrayModifier]) -> Optional[Object]:
-        return None if array_mod is None else find_offset_empty(array_mod)
-
-    @staticmethod
-    def get_props(ob: Object, array_mod: Optional[ArrayModifier], name: str) -> \
-            Optional["properties.RadialArrayPropsGroup"]:
-        return None if array_mod is None else find_props(ob, name)
-
-    @staticmethod
-    def get_nodes_mod(ob: Object, array_mod: Optional[ArrayModifier], name: str) -> Optional[NodesModifier]:
-        return None if array_mod is None else find_nodes_mod(ob, name)
-
-    @staticmethod
-    def get_center_empty(
-        array_mod: Optional[ArrayModifier], props: Optional["properties.RadialArrayPropsGroup"]
-    ) -> Optional[Object]:
-        return find_center_empty(props) if array_mod is not None and props is not None else None
-
-
-class NewRadialArrayBuilder:
-    @staticmethod
-    def get_array_mod(context: Context, ob: Object) -> ArrayModifier:
-        return new_array_mod(context, ob)
-
-    @staticmethod
-    def get_name(array_mod: ArrayModifier) -> str:
-        return array_mod.name
-
-    @staticmethod
-    def get_offset_empty(context: Context, ob: Object, array_mod: ArrayModifier) -> Object:
-        return new_offset_empty(context, ob, array_mod)
-
-    @staticmethod
-    def get_props(ob: Object, array_mod: ArrayModifier, name: str) -> "properties.RadialArrayPropsGroup":
-        props = find_props(ob, name)
-        if props is None:
-            props = new_props(ob, array_mod, name)
-        return props
-
-    @staticmethod
-    def get_nodes_mod(ob: Object, name: str) -> Optional[NodesModifier]:
-        return find_nodes_mod(ob, name)
-
-    @staticmethod
-    def get_center_empty() -> None:
-        return None
-
-
 class RadialArrayDirector:
     def __init__(self, cls, object_radial_arrays):
         self.cls = cls
         self.object_radial_arrays = object_radial_arrays
 
     def build_from_modifier(self, array_mod_name=""):
-        builder = ExistingRadialArrayBuilder
-
         context = self.object_radial_arrays.context
         ob = self.object_radial_arrays.object
 
-        array_mod = builder.get_array_mod(ob, array_mod_name)
+        array_mod = find_array_mod(ob, array_mod_name)
         if array_mod is None:
             return None
 
-        radial_array_name = builder.get_name(array_mod)
-        offset_empty = builder.get_offset_empty(array_mod)
-        props = builder.get_props(ob, array_mod, radial_array_name)
+        radial_array_name = array_mod.name
+        offset_empty = find_offset_empty(array_mod)
+        props = find_props(ob, radial_array_name)
 
         if props is None:
-            props = NewRadialArrayBuilder.get_props(ob, array_mod, radial_array_name)
+            props = new_props(ob, array_mod, radial_array_name)
             restore_props(ob, array_mod, offset_empty, props)
         if offset_empty is None:
-            offset_empty = NewRadialArrayBuilder.get_offset_empty(context, ob, array_mod)
+            offset_empty = new_offset_empty(context, ob, array_mod)
 
-        nodes_mod = builder.get_nodes_mod(ob, array_mod, radial_array_name)
-        center_empty = builder.get_center_empty(array_mod, props)
+        base_name, index = split_name_index(radial_array_name)
+        nodes_mod = find_nodes_mod(ob, base_name, index)
+        center_empty = find_center_empty(props)
 
         remove_junk_props(ob)
         fix_nodes_mod(ob, array_mod, nodes_mod)
@@ -407,16 +357,16 @@ class RadialArrayDirector:
                         offset_empty)
 
     def build_new(self):
-        builder = NewRadialArrayBuilder()
-
         context = self.object_radial_arrays.context
         ob = self.object_radial_arrays.object
-        array_mod = builder.get_array_mod(context, ob)
-        radial_array_name = builder.get_name(array_mod)
-
-        offset_empty = builder.get_offset_empty(context, ob, array_mod)
-        builder.get_props(ob, array_mod, radial_array_name)
-        nodes_mod = builder.get_nodes_mod(ob, radial_array_name)
+        array_mod = new_array_mod(context, ob)
+        radial_array_name = array_mod.name
+
+        offset_empty = new_offset_empty(context, ob, array_mod)
+        if find_props(ob, radial_array_name) is None:
+            new_props(ob, array_mod, radial_array_name)
+        base_name, index = split_name_index(radial_array_name)
+        nodes_mod = find_nodes_mod(ob, base_name, index)
         center_empty = None
 
         remove_junk_props(ob)
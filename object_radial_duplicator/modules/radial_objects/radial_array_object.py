@@ -1,5 +1,6 @@
-from math import radians
-from typing import Union, Optional
+from math import isclose
+from math import tau
+from typing import NamedTuple, Union, Optional
 
 import bpy
 import numpy as np
@@ -7,16 +8,18 @@ from bpy.types import ArrayModifier
 from bpy.types import Context
 from bpy.types import NodesModifier
 from bpy.types import Object
-from mathutils import Euler
 from mathutils import Matrix
 from mathutils import Vector
 
 from .. import properties
+from ..utils.math import AXIS_INDEX
 from ..utils.math import get_axis_vec
+from ..utils.math import rotation_about_point
 from ..utils.object import clear_children_parent_and_keep_mx
 from ..utils.object import get_normal_matrix
 from ..utils.object import set_children_parent_and_keep_mx
 from ..utils.object import set_origin
+from ..utils.object import split_name_index
 from ..utils.object_data import get_data_center_co_world
 from ..utils.object_data import get_mesh_selection_co_world
 from ..radial_objects.radial_array_builder import new_nodes_mod
@@ -24,28 +27,53 @@ from ..radial_objects.radial_array_builder import new_center_empty
 from ..radial_objects.radial_array_builder import RadialArrayDirector
 
 
+_TAU = tau
+_ANGLE_TOL = 1e-5
+# enum item values of RadialArrayPropsGroup, for writing enums as id properties
+_SPIN_ORIENTATION_INDEX = {'GLOBAL': 0, 'LOCAL': 1, 'VIEW': 2, 'NORMAL': 3}
+
+
+class _RefreshCtx(NamedTuple):
+    """Values shared by all parts of a radial array during a single refresh."""
+    mx_world: Matrix
+    mx_world_inv: Matrix
+    spin_vec_object: Vector
+    props_value: "properties.RadialArrayPropsGroup"
+
+
 class ObjectRadialArrays:
     """Class for getting or controlling RadialArrays on object"""
     def __init__(self, context: Context, ob: Object):
         self.context: Context = context
         self.object: Object = ob
         self.value: list["RadialArray"] = self._get_radial_arrays()
+        self._name_index: Optional[dict[str, int]] = None
 
     def _get_radial_arrays(self) -> list["RadialArray"]:
-        ob_mods = self.object.modifiers
-        radial_array_modifier_names = [mod.name for mod in ob_mods if mod.type == 'ARRAY' and "Radial" in mod.name]
-        radial_arrays = [RadialArray.from_modifier(self, name) for name in radial_array_modifier_names]
-        return radial_arrays
+        # Collect names first, building radial array can add modifiers to the object.
+        radial_array_modifier_names = []
+        for mod in self.object.modifiers:
+            if mod.type == 'ARRAY':
+                name = mod.name
+                if "Radial" in name:
+                    radial_array_modifier_names.append(name)
+        return [RadialArray.from_modifier(self, name) for name in radial_array_modifier_names]
+
+    def _get_name_index(self) -> dict[str, int]:
+        """Get radial array positions by their names, building them if they are outdated."""
+        if self._name_index is None:
+            self._name_index = {radial_array.name: i for i, radial_array in enumerate(self.value)}
+        return self._name_index
+
+    def invalidate_name_index(self) -> None:
+        """Mark radial array positions by names as outdated, after radial arrays were removed."""
+        self._name_index = None
 
     def __getitem__(self, key: Union[str, int]) -> Optional["RadialArray"]:
         """Get radial array from class dict or create it from modifier and add to class dict."""
         if type(key) is str:
-            names = [radial_array.name for radial_array in self.value]
-            if key in names:
-                i = names.index(key)
-                radial_array = self.value[i]
-            else:
-                radial_array = None
+            i = self._get_name_index().get(key)
+            radial_array = self.value[i] if i is not None else None
 
         elif type(key) is int:
             # https://stackoverflow.com/questions/2492087/how-to-get-the-nth-element-of-a-python-list-or-a-default-if-not-available # noqa
@@ -59,17 +87,27 @@ class ObjectRadialArrays:
 
         return radial_array
 
+    def index(self, radial_array: "RadialArray") -> int:
+        """Get position of radial array in object modifier stack order."""
+        return self._get_name_index()[radial_array.name]
+
     def new(self) -> "RadialArray":
         """Build new radial array and store it in class dict."""
         radial_array = RadialArray.new(self)
 
         self.value.append(radial_array)
+        # appending doesn't shift other positions
+        if self._name_index is not None:
+            self._name_index[radial_array.name] = len(self.value) - 1
         return radial_array
 
     def refresh_all(self) -> None:
         """Refresh all object radial arrays."""
+        # Radial arrays share the object, so its matrix is inverted once for all of them.
+        mx_world = self.object.matrix_world.copy()
+        mx_world_inv = mx_world.inverted()
         for radial_array in self.value:
-            radial_array.refresh()
+            radial_array.refresh(mx_world, mx_world_inv)
 
     def ensure_center_empties_of_child_radial_arrays(self) -> None:
         """Add center empty to non-top radial arrays if it's missing."""
@@ -122,8 +160,8 @@ class RadialArray:
         self.pivot_point = RadialArrayPivotPoint(self)
 
     @property
-    def spin_vec_object(self):
-        ob = self.object
+    def spin_vec_object(self) -> Vector:
+        """Get normalized spin axis in object space."""
         props = self.properties
 
         # Get new spin orientation from operator attributes on properties update,
@@ -131,12 +169,14 @@ class RadialArray:
         # Last orientation is stored in object space.
         # Storing it in global space wouldn't allow radial array to be properly
         # restored if object has been rotated since then.
-        spin_orientation_matrix_world = ob.matrix_world @ props.value.spin_orientation_matrix_object
+        # Axis of world orientation is the stored axis rotated by the object matrix,
+        # so the whole orientation matrix isn't built to read one column of it.
+        mx_world = self.object.matrix_world
         spin_axis = props.value.spin_axis
-        spin_vec_world = get_axis_vec(spin_axis, spin_orientation_matrix_world)
-        spin_vec_object = spin_vec_world @ ob.matrix_world
+        spin_vec_world = mx_world.to_3x3() @ get_axis_vec(spin_axis, props.value.spin_orientation_matrix_object)
+        spin_vec_object = spin_vec_world @ mx_world
 
-        return spin_vec_object
+        return spin_vec_object.normalized()
 
     def modify(
         self,
@@ -167,12 +207,20 @@ class RadialArray:
         else:
             self.refresh()
 
-    def refresh(self) -> None:
-        """Spin radial array not changing its parameters."""
+    def refresh(self, mx_world: Optional[Matrix] = None, mx_world_inv: Optional[Matrix] = None) -> None:
+        """Spin radial array not changing its parameters.
+
+        :param mx_world: Object world matrix, if it's already known.
+        :param mx_world_inv: Inverted object world matrix, if it's already known.
+        """
+        if mx_world is None or mx_world_inv is None:
+            mx_world = self.object.matrix_world
+            mx_world_inv = mx_world.inverted()
+        ctx = _RefreshCtx(mx_world, mx_world_inv, self.spin_vec_object, self.properties.value)
         if self.object.type == 'MESH':
-            self.nodes_modifier.refresh()
-        self.array_modifier.refresh()
-        self.offset_empty.refresh()
+            self.nodes_modifier.refresh(ctx)
+        self.array_modifier.refresh(ctx)
+        self.offset_empty.refresh(ctx)
 
     def set_pivot_point(self, point: Union[str, Vector]) -> None:
         """Set pivot point and refresh radial array.
@@ -189,6 +237,7 @@ class RadialArray:
         success_msg = self.array_modifier.apply()
         self.offset_empty.remove()
         self.siblings.value.remove(self)
+        self.siblings.invalidate_name_index()
         self.siblings.remove_center_empty_of_top_radial_array()
         return success_msg
 
@@ -200,6 +249,7 @@ class RadialArray:
         self.array_modifier.remove()
         self.offset_empty.remove()
         self.siblings.value.remove(self)
+        self.siblings.invalidate_name_index()
         self.siblings.remove_center_empty_of_top_radial_array()
 
 
@@ -226,12 +276,16 @@ class RadialArrayProps:
         context = self._radial_array.context
         ob = self._radial_array.object
 
-        return {
-            'GLOBAL': lambda: Matrix.Identity(4),
-            'LOCAL': lambda: ob.matrix_world.copy(),
-            'VIEW': lambda: context.space_data.region_3d.view_matrix.inverted(),
-            'NORMAL': lambda: get_normal_matrix(context, ob),
-        }[spin_orientation]()
+        if spin_orientation == 'GLOBAL':
+            return Matrix.Identity(4)
+        elif spin_orientation == 'LOCAL':
+            return ob.matrix_world.copy()
+        elif spin_orientation == 'VIEW':
+            return context.space_data.region_3d.view_matrix.inverted()
+        elif spin_orientation == 'NORMAL':
+            return get_normal_matrix(context, ob)
+        else:
+            raise KeyError(spin_orientation)
 
     def update(self,
                spin_orientation: str,
@@ -243,21 +297,24 @@ class RadialArrayProps:
                height_offset: float) -> None:
         """Update property group."""
         ob = self._radial_array.object
+        # property group is looked up by name, so resolve it once
+        value = self.value
 
-        spin_orientation_enums = self.value.bl_rna.properties["spin_orientation"].enum_items
-        self.value["spin_orientation"] = spin_orientation_enums.find(spin_orientation)
         spin_orientation_matrix = self._get_spin_orientation_matrix(spin_orientation)
         spin_orientation_matrix_object = ob.matrix_world.inverted() @ spin_orientation_matrix
 
+        # Write through id properties to not trigger property update callbacks.
+        value["spin_orientation"] = _SPIN_ORIENTATION_INDEX[spin_orientation]
+        # flatten in column-major order, as matrix properties are stored
         # noinspection PyTypeChecker
-        self.value["spin_orientation_matrix_object"] = np.array(spin_orientation_matrix_object).T.ravel()
-        spin_axis_enums = self.value.bl_rna.properties["spin_axis"].enum_items
-        self.value["spin_axis"] = spin_axis_enums.find(spin_axis)
-        self.value["count"] = count
-        self.value["radius_offset"] = radius_offset
-        self.value["start_angle"] = start_angle
-        self.value["end_angle"] = end_angle
-        self.value["height_offset"] = height_offset
+        mx_flat = np.array(spin_orientation_matrix_object, dtype=np.float32).ravel(order='F')
+        value["spin_orientation_matrix_object"] = mx_flat
+        value["spin_axis"] = AXIS_INDEX[spin_axis]
+        value["count"] = count
+        value["radius_offset"] = radius_offset
+        value["start_angle"] = start_angle
+        value["end_angle"] = end_angle
+        value["height_offset"] = height_offset
 
     def remove(self) -> None:
         """Remove property group if it exists."""
@@ -274,14 +331,17 @@ class RadialArrayArrayMod:
         self._radial_array = radial_array
         self.value = value
 
-    def refresh(self) -> None:
-        props = self._radial_array.properties.value
-        spin_vec_object = self._radial_array.spin_vec_object
+    def refresh(self, ctx: _RefreshCtx) -> None:
+        props = ctx.props_value
 
-        self.value.count = props.count
-        self.value.use_constant_offset = True
-        height_offset_vec = spin_vec_object.normalized() * props.height_offset
-        self.value.constant_offset_displace = height_offset_vec
+        # Every write tags the depsgraph, so only write changed values.
+        if self.value.count != props.count:
+            self.value.count = props.count
+        if not self.value.use_constant_offset:
+            self.value.use_constant_offset = True
+        height_offset_vec = ctx.spin_vec_object * props.height_offset
+        if self.value.constant_offset_displace != height_offset_vec:
+            self.value.constant_offset_displace = height_offset_vec
 
     def apply(self) -> str:
         """Apply array modifier if it exists and return success message confirmation."""
@@ -311,18 +371,16 @@ class RadialArrayNodesMod:
         self._radial_array = radial_array
         self.value = value
 
-    @property
-    def displace_offset_vec_object(self) -> Vector:
-        """Get displace vector in ob space."""
+    def _get_displace_offset_vec_object(self, ctx: _RefreshCtx) -> Optional[Vector]:
+        """Get displace vector in ob space or None if there is no displacement."""
         ob = self._radial_array.object
-        props = self._radial_array.properties.value
+        props = ctx.props_value
         pivot_point_co = self._radial_array.pivot_point.co_world
-        spin_vec_object = self._radial_array.spin_vec_object
 
         if props.radius_offset == 0:
-            return Vector((0, 0, 0))
+            return None
         else:
-            pivot_mx = ob.matrix_world.copy()
+            pivot_mx = ctx.mx_world.copy()
             pivot_mx.translation = pivot_point_co
             data_center_co_pivot = pivot_mx.inverted() @ get_data_center_co_world(ob)
 
@@ -330,45 +388,45 @@ class RadialArrayNodesMod:
                 Vector((1, 1, 1)) if data_center_co_pivot.length_squared < 0.001 else data_center_co_pivot
             )
 
-            projection = non_aligned_displace_vec.project(spin_vec_object)
+            projection = non_aligned_displace_vec.project(ctx.spin_vec_object)
             rejection = non_aligned_displace_vec - projection
 
             aligned_displace_vec_local = rejection.normalized()
             displace_offset_vec = aligned_displace_vec_local * props.radius_offset
-            return displace_offset_vec
+            # rejection is zero if pivot lies on spin axis
+            return displace_offset_vec if displace_offset_vec.length_squared else None
 
-    def _get_start_rotation_matrix(self) -> Euler:
-        """Get object rotation to achieve radial array starting rotation."""
-        props = self._radial_array.properties.value
-        spin_vec_object = self._radial_array.spin_vec_object
+    def _get_start_rotation_matrix(self, ctx: _RefreshCtx) -> tuple[float, float, float]:
+        """Get object rotation as euler angles to achieve radial array starting rotation."""
+        props = ctx.props_value
 
-        # noinspection PyArgumentList
         return (
-            Euler((0, 0, 0))
+            (0.0, 0.0, 0.0)
             if props.start_angle == 0
-            else Matrix.Rotation(props.start_angle, 4, spin_vec_object).to_euler()
+            else Matrix.Rotation(props.start_angle, 3, ctx.spin_vec_object).to_euler()[:]
         )
 
-    def refresh(self) -> None:
-        start_rotation = self._get_start_rotation_matrix()
-        displace_offset_vec = self.displace_offset_vec_object
-        ob = self._radial_array.object
+    def refresh(self, ctx: _RefreshCtx) -> None:
+        start_rotation = self._get_start_rotation_matrix(ctx)
+        displace_offset_vec = self._get_displace_offset_vec_object(ctx)
         center_empty = self._radial_array.center_empty.value
 
-        if start_rotation[:] != (0, 0, 0) or displace_offset_vec[:] != (0, 0, 0):
+        if start_rotation != (0.0, 0.0, 0.0) or displace_offset_vec is not None:
 
             if self.value is None:
                 self.add()
 
             node_group = self.value.node_group
             node = node_group.nodes["StartRotation"]
-            node.inputs["Rotation"].default_value = start_rotation[:]
+            node.inputs["Rotation"].default_value = start_rotation
             node = node_group.nodes["RadiusOffset"]
-            node.inputs["Translation"].default_value = displace_offset_vec[:]
+            node.inputs["Translation"].default_value = (
+                (0, 0, 0) if displace_offset_vec is None else displace_offset_vec[:]
+            )
 
             if center_empty is not None:
                 center_empty_mx = center_empty.matrix_world
-                center_empty_mx_ob = ob.matrix_world.inverted() @ center_empty_mx
+                center_empty_mx_ob = ctx.mx_world_inv @ center_empty_mx
 
                 node = node_group.nodes["ObjectPivotToRadialArrayCenter"]
                 node.inputs["Translation"].default_value = center_empty_mx_ob.inverted().to_translation()
@@ -392,7 +450,8 @@ class RadialArrayNodesMod:
         array_mod = self._radial_array.array_modifier.value
         props = self._radial_array.properties.value
 
-        self.value = new_nodes_mod(ob, array_mod, props, name)
+        base_name, index = split_name_index(name)
+        self.value = new_nodes_mod(ob, array_mod, props, base_name, index)
 
     def apply(self) -> None:
         """Apply nodes modifier if it exists."""
@@ -448,61 +507,53 @@ class RadialArrayOffsetEmpty:
         self._radial_array = radial_array
         self.value = value
 
-    def refresh(self) -> None:
+    def refresh(self, ctx: _RefreshCtx) -> None:
         """Rotate offset empty across pivot point."""
         ob = self._radial_array.object
-        props = self._radial_array.properties.value
+        props = ctx.props_value
         pivot_point_co_world = self._radial_array.pivot_point.co_world
-        spin_vec_object = self._radial_array.spin_vec_object
-        spin_vec_world = spin_vec_object @ ob.matrix_world.inverted()
+        spin_vec_object = ctx.spin_vec_object
+        # world axis is built from the stored orientation, the same way spin_vec_object starts
+        spin_vec_world = ctx.mx_world.to_3x3() @ get_axis_vec(props.spin_axis, props.spin_orientation_matrix_object)
+        spin_vec_world.normalize()
 
-        if props.count > 1:
+        count = props.count
+        if count > 1:
             # calculate angle
+            end_angle = props.end_angle
+            start_angle = props.start_angle
+            inv_count_minus_one = 1.0 / (count - 1)
             full_circle = (
-                round(props.end_angle, 5) == round(radians(360), 5)
-                and props.start_angle == 0
+                isclose(end_angle, _TAU, abs_tol=_ANGLE_TOL)
+                and start_angle == 0
                 and props.height_offset == 0
             )
             if full_circle:
-                spin_angle = props.end_angle / props.count - props.start_angle / (props.count - 1)
+                spin_angle = end_angle / count - start_angle * inv_count_minus_one
             else:
-                spin_angle = props.end_angle / (props.count - 1) - props.start_angle / (props.count - 1)
+                spin_angle = (end_angle - start_angle) * inv_count_minus_one
 
             # transform
-            children = self.value.children
-            clear_children_parent_and_keep_mx(self.value)
+            offset_empty = self.value
+            # children lookup scans all objects, so do it once
+            children = tuple(offset_empty.children)
+            is_parented_to_ob = offset_empty.parent == ob
+            clear_children_parent_and_keep_mx(offset_empty, children)
 
-            if self.value.parent == ob:
+            if is_parented_to_ob:
                 # pivot point in object space
-                pivot_point_co_object = ob.matrix_world.inverted() @ pivot_point_co_world
+                pivot_point_co_object = ctx.mx_world_inv @ pivot_point_co_world
                 # reset offset empty matrix
-                self.value.matrix_parent_inverse.identity()
-                self.value.matrix_basis.identity()
-                # move offset empty to object origin
-                tra = Matrix.Translation(Vector((0, 0, 0)))
+                offset_empty.matrix_parent_inverse.identity()
                 # rotation of offset empty around radial array pivot. offset empty starts in object origin
-                rot = (
-                    Matrix.Translation(pivot_point_co_object)
-                    @ Matrix.Rotation(spin_angle, 4, spin_vec_object)
-                    @ Matrix.Translation(-pivot_point_co_object)
-                )
-                # (1, 1, 1) scale
-                sca = Matrix.Diagonal(Matrix.Identity(4).to_scale().to_4d())
-                # compose matrix
-                self.value.matrix_basis = tra @ rot @ sca
+                # with (1, 1, 1) scale, so rotation is its whole basis matrix
+                offset_empty.matrix_basis = rotation_about_point(spin_vec_object, spin_angle, pivot_point_co_object)
             else:
-                # align with object
-                self.value.matrix_world = ob.matrix_world
-                # rotation of offset empty around radial array pivot. offset empty starts in object origin
-                rot = (
-                    Matrix.Translation(pivot_point_co_world)
-                    @ Matrix.Rotation(spin_angle, 4, spin_vec_world)
-                    @ Matrix.Translation(-pivot_point_co_world)
-                )
-                # apply rotation
-                self.value.matrix_world = rot @ self.value.matrix_world
-
-            set_children_parent_and_keep_mx(children, self.value)
+                # rotation of offset empty around radial array pivot. offset empty starts aligned with object
+                rot = rotation_about_point(spin_vec_world, spin_angle, pivot_point_co_world)
+                offset_empty.matrix_world = rot @ ctx.mx_world
+
+            set_children_parent_and_keep_mx(children, offset_empty)
 
     def remove(self) -> None:
         """Remove offset empty if it exists."""
@@ -1,7 +1,8 @@
-from typing import Union, Optional
+from contextlib import contextmanager
+from typing import Iterator, Union, Optional
 
-import random
-from math import radians
+from math import isclose
+from math import tau
 
 import bpy
 import numpy as np
@@ -12,6 +13,7 @@ from mathutils import Vector
 
 from .. import properties
 from ..utils.math import get_axis_vec
+from ..utils.math import get_rotation_matrices
 from ..utils.object import clear_children_parent_and_keep_mx
 from ..utils.object import get_normal_matrix
 from ..utils.object import set_children_parent_and_keep_mx, set_parent_and_keep_mx
@@ -19,6 +21,10 @@ from ..utils.object_data import get_mesh_selection_co_world
 from ..radial_objects.radial_duplicates_builder import RadialDuplicatesDirector
 
 
+_TAU = tau
+_ANGLE_TOL = 1e-5
+
+
 class RadialDuplicates:
     @classmethod
     def from_props(cls, context: Context, props: "properties.RadialDuplicatesPropsGroup"):
@@ -41,9 +47,15 @@ class RadialDuplicates:
         self.properties = RadialDuplicatesProps(self)
         self.center_empty = RadialDuplicatesCenterEmpty(self, center_empty)
         self.pivot_point = RadialDuplicatesPivotPoint(self)
+        self._last_sig: Optional[tuple] = None
+        self._props_cache: Optional["properties.RadialDuplicatesPropsGroup"] = None
+        self._spin_vec_world_cache: Optional[Vector] = None
 
     @property
-    def spin_vec_object(self):
+    def spin_vec_world(self) -> Vector:
+        if self._spin_vec_world_cache is not None:
+            return self._spin_vec_world_cache
+
         center_empty = self.center_empty.value
         props = self.properties
 
@@ -52,12 +64,14 @@ class RadialDuplicates:
         # Last orientation is stored in object space.
         # Storing it in global space wouldn't allow radial duplicates to be properly
         # restored if object has been rotated since then.
-        spin_orientation_matrix_world = center_empty.matrix_world @ props.value.spin_orientation_matrix_object
+        # only one column of the world orientation matrix is needed, so it's transformed alone
         spin_axis = props.value.spin_axis
-        spin_vec_world = get_axis_vec(spin_axis, spin_orientation_matrix_world)
-        spin_vec_object = spin_vec_world @ center_empty.matrix_world
+        spin_vec_center = get_axis_vec(spin_axis, props.value.spin_orientation_matrix_object)
+        return center_empty.matrix_world.to_3x3() @ spin_vec_center
 
-        return spin_vec_object
+    @property
+    def spin_vec_object(self) -> Vector:
+        return self.spin_vec_world @ self.center_empty.value.matrix_world
 
     def modify(
         self,
@@ -83,17 +97,67 @@ class RadialDuplicates:
         duplicate in [-inf, inf].
         :param pivot_point: Point in ['ORIGIN', 'CURSOR', 'MESH_SELECTION', 'ACTIVE_OBJECT', 'Vector', None].
         """
-        self.properties.update(spin_orientation, spin_axis, duplicates_rotation, count, end_angle, end_scale,
-                               height_offset)
-        if pivot_point is not None:
-            self.set_pivot_point(pivot_point)
-        else:
-            self.refresh()
+        with self._stable_props():
+            self.properties.update(spin_orientation, spin_axis, duplicates_rotation, count, end_angle, end_scale,
+                                   height_offset)
+            if pivot_point is not None:
+                self.set_pivot_point(pivot_point)
+            else:
+                self.refresh()
+
+    @contextmanager
+    def _stable_props(self) -> Iterator[None]:
+        """Keep property group retrieved once for the duration of the operation.
+
+        Duplicates properties are stored on the center empty, which isn't added or removed during the operation.
+        """
+        if self._props_cache is not None:
+            yield
+            return
+
+        self._props_cache = self.center_empty.value.radial_duplicator.duplicates[0]
+        try:
+            yield
+        finally:
+            self._props_cache = None
+
+    def _get_refresh_sig(self) -> tuple:
+        """Get everything the placement of duplicates depends on."""
+        props = self.properties.value
+
+        return (
+            props.count,
+            props.end_angle,
+            props.end_scale,
+            props.height_offset,
+            props.spin_axis,
+            props.duplicates_rotation,
+            props.spin_orientation_matrix_object.copy(),
+            self.center_empty.value.matrix_world.copy(),
+            self.starting_object.value.matrix_world.copy(),
+        )
 
     def refresh(self) -> None:
         """Spin radial duplicates not changing its parameters."""
-        self.starting_object.refresh()
-        self.duplicated_objects.refresh()
+        with self._stable_props():
+            # Refresh removes and copies duplicates, so skip it if nothing has changed since the last one.
+            sig = self._get_refresh_sig()
+            if sig == self._last_sig:
+                return
+            self._last_sig = sig
+
+            # Neither center empty nor spin orientation changes while refreshing,
+            # so spin vector is calculated once for all duplicates.
+            self._spin_vec_world_cache = self.spin_vec_world
+            try:
+                self.starting_object.refresh()
+                self.duplicated_objects.refresh()
+            finally:
+                self._spin_vec_world_cache = None
+
+            # Duplicates matrices are assigned, not read, while refreshing,
+            # so depsgraph of new duplicates is updated only once at the end.
+            self.context.evaluated_depsgraph_get().update()
 
     def set_pivot_point(self, point: Union[str, Vector]) -> None:
         """Set pivot point and refresh radial duplicates.
@@ -117,7 +181,11 @@ class RadialDuplicatesProps:
     def value(self) -> "properties.RadialDuplicatesPropsGroup":
         # Re-allocation can lead to crashes (e.g. if you add a lot of items to some Collection, this can lead
         # to re-allocating the underlying container’s memory, invalidating all previous references to existing items).
-        # So, don't store collection item and retrieve it by a name instead
+        # So, don't store collection item and retrieve it by a name instead.
+        # Only reuse it while an operation that doesn't add collection items runs.
+        props_cache = self._radial_duplicates._props_cache
+        if props_cache is not None:
+            return props_cache
 
         center_empty = self._radial_duplicates.center_empty.value
         return center_empty.radial_duplicator.duplicates[0]
@@ -188,34 +256,49 @@ class RadialDuplicatesDuplicatedObjects:
     def __init__(self, radial_duplicates: RadialDuplicates, value: Optional[Object]):
         self._radial_duplicates = radial_duplicates
         self.value = value
+        # duplicates copied by this instance match the starting object, found ones may be outdated
+        self._synced = False
 
     def _set_count(self):
         starting_ob = self._radial_duplicates.starting_object.value
         props = self._radial_duplicates.properties.value
         context = self._radial_duplicates.context
 
-        if context.view_layer.objects.active in self.value:
-            context.view_layer.objects.active = starting_ob
-            for ob in context.selected_objects:
-                ob.select_set(False)
-            starting_ob.select_set(True)
-            context.view_layer.objects.active = starting_ob
+        old_dupli_obs = [ob for ob in self.value if ob != starting_ob]
+        dupli_count = props.count - 1
 
-        for ob in self.value:
-            if ob != starting_ob:
+        if self._synced:
+            # starting object can't change between refreshes of one operation,
+            # so duplicates copied earlier are kept and only the difference is removed or added
+            dupli_obs = old_dupli_obs[:dupli_count]
+            excess_obs = old_dupli_obs[dupli_count:]
+        else:
+            # starting object data, modifiers or materials may have changed since duplicates were copied
+            dupli_obs = []
+            excess_obs = old_dupli_obs
+
+        if excess_obs:
+            if context.view_layer.objects.active in excess_obs:
+                # only duplicates are deselected, selection of other objects is kept
+                for ob in old_dupli_obs:
+                    ob.select_set(False)
+                starting_ob.select_set(True)
+                context.view_layer.objects.active = starting_ob
+
+            for ob in excess_obs:
                 clear_children_parent_and_keep_mx(ob)
                 bpy.data.objects.remove(ob, do_unlink=True)
-        self.value = []
 
-        dupli_obs = []
-        for i in range(props.count - 1):
-            dupli_ob = starting_ob.copy()
-            starting_ob.users_collection[0].objects.link(dupli_ob)
-            dupli_obs.append(dupli_ob)
+        if len(dupli_obs) < dupli_count:
+            collection_objects = starting_ob.users_collection[0].objects
+            for i in range(dupli_count - len(dupli_obs)):
+                # object copy shares mesh data instead of copying it
+                dupli_ob = starting_ob.copy()
+                collection_objects.link(dupli_ob)
+                dupli_obs.append(dupli_ob)
 
-        # matrix_world of the newly created object updates after updating depsgraph
-        context.evaluated_depsgraph_get().update()
         self.value = dupli_obs
+        self._synced = True
 
     @property
     def displace_offset_vec_object(self) -> Vector:
@@ -247,68 +330,84 @@ class RadialDuplicatesDuplicatedObjects:
         center_empty = self._radial_duplicates.center_empty.value
         props = self._radial_duplicates.properties.value
         pivot_point_co_world = self._radial_duplicates.pivot_point.co_world
-        spin_vec_object = self._radial_duplicates.spin_vec_object
-        spin_vec_world = spin_vec_object @ center_empty.matrix_world.inverted()
+        # spin_vec_object is derived from spin_vec_world, so take both without inverting the matrix back
+        spin_vec_world = self._radial_duplicates.spin_vec_world
+        spin_vec_object = spin_vec_world @ center_empty.matrix_world
+
+        # read properties once, each access goes through rna
+        count = props.count
+        end_angle = props.end_angle
+        end_scale = props.end_scale
+        height_offset = props.height_offset
+        duplicates_rotation = props.duplicates_rotation
 
-        if props.count > 1:
+        if count > 1:
             # calculate angle
-            full_circle = round(props.end_angle, 5) == round(radians(360), 5) and props.height_offset == 0
+            full_circle = isclose(end_angle, _TAU, abs_tol=_ANGLE_TOL) and height_offset == 0
             if full_circle:
-                step_angle = props.end_angle / props.count
+                step_angle = end_angle / count
             else:
-                step_angle = props.end_angle / (props.count - 1)
+                step_angle = end_angle / (count - 1)
 
             # calculate scale
-            spaced_scale = np.linspace(1.0, props.end_scale, props.count)
+            scale_step = (end_scale - 1.0) / (count - 1)
+
+            # Compute matrices of all duplicates at once.
+            dupli_count = len(self.value)
+            dupli_ids = np.arange(1, dupli_count + 1)
+
+            # starting object offset in height and rotated around spin axis,
+            # composed as 3x3 blocks and translations instead of stacks of 4x4 matrices
+            starting_mx = starting_ob.matrix_world.copy()
+            height_offset_vec = spin_vec_object.normalized() * height_offset
+            pivot_co = np.array(pivot_point_co_world)
+            rot_mxs = get_rotation_matrices(spin_vec_world, dupli_ids * step_angle)
+            starting_co_pivot = np.array(starting_mx.translation) - pivot_co
+            mxs = np.tile(np.identity(4), (dupli_count, 1, 1))
+            if height_offset != 0:
+                offset_cos = starting_co_pivot + dupli_ids[:, np.newaxis] * np.array(height_offset_vec)
+                mxs[:, :3, 3] = pivot_co + np.einsum('nij,nj->ni', rot_mxs, offset_cos)
+            else:
+                mxs[:, :3, 3] = pivot_co + rot_mxs @ starting_co_pivot
+
+            # rotation around own axis, only the chosen basis is computed
+            starting_mx_3x3 = np.array(starting_mx.to_3x3())
+            match duplicates_rotation:
+                case 'KEEP':
+                    # normalized starting rotation scaled by starting scale is the starting matrix itself
+                    basis = starting_mx_3x3
+                case 'RANDOM':
+                    # rotation around spin axis doesn't change scale, so duplicates keep scale of starting object
+                    own_sca = np.diag(np.linalg.norm(starting_mx_3x3, axis=0))
+                    random_angles = np.random.default_rng().uniform(0.0, 2 * np.pi, dupli_count)
+                    basis = get_rotation_matrices(spin_vec_world, random_angles) @ own_sca
+                case _:
+                    basis = rot_mxs @ starting_mx_3x3
+
+            # scale around own origin
+            if end_scale != 1.0:
+                basis = basis * (1.0 + dupli_ids * scale_step)[:, np.newaxis, np.newaxis]
+            mxs[:, :3, :3] = basis
 
             # transform
-            for i, dupli_ob in enumerate(self.value, start=1):
-                children = dupli_ob.children
-                clear_children_parent_and_keep_mx(dupli_ob)
-
-                # align with starting object
-                dupli_ob.matrix_world = starting_ob.matrix_world
-                dupli_ob.matrix_world.translation = (
-                    dupli_ob.matrix_world.to_translation() + spin_vec_object.normalized() * props.height_offset * i
-                )
-                # rotation around spin axis
-                rot = (
-                    Matrix.Translation(pivot_point_co_world)
-                    @ Matrix.Rotation(i * step_angle, 4, spin_vec_world)
-                    @ Matrix.Translation(-pivot_point_co_world)
-                )
-                dupli_ob.matrix_world = rot @ dupli_ob.matrix_world
-
-                # rotation around own axis
-                match props.duplicates_rotation:
-                    case 'KEEP':
-                        R = starting_ob.matrix_world.to_3x3().normalized().to_4x4()
-                        T = Matrix.Translation(dupli_ob.matrix_world.to_translation())
-                        S = Matrix.Diagonal(dupli_ob.matrix_world.to_scale().to_4d())
-                        dupli_ob.matrix_world = T @ R @ S
-                    case 'RANDOM':
-                        R = Matrix.Rotation(random.randrange(0, 360), 4, spin_vec_world)
-                        T = Matrix.Translation(dupli_ob.matrix_world.to_translation())
-                        S = Matrix.Diagonal(dupli_ob.matrix_world.to_scale().to_4d())
-                        dupli_ob.matrix_world = T @ R @ S
-
-                # scale
-                scale_vec = Vector((spaced_scale[i],) * 3)
-
-                sca = (
-                    Matrix.Translation(dupli_ob.matrix_world.to_translation())
-                    @ Matrix.Diagonal(scale_vec).to_4x4()
-                    @ Matrix.Translation(-dupli_ob.matrix_world.to_translation())
-                )
-                dupli_ob.matrix_world = sca @ dupli_ob.matrix_world
-
-                set_children_parent_and_keep_mx(children, dupli_ob)
+            for dupli_ob, mx in zip(self.value, mxs.tolist()):
+                # fresh duplicates usually have no children to keep in place
+                children = tuple(dupli_ob.children)
+                if children:
+                    clear_children_parent_and_keep_mx(dupli_ob, children)
+
+                dupli_ob.matrix_world = Matrix(mx)
+
+                if children:
+                    set_children_parent_and_keep_mx(children, dupli_ob)
 
     def _set_parent(self):
         center_empty = self._radial_duplicates.center_empty.value
 
+        # all duplicates share the parent, so invert its matrix once
+        center_empty_mx_inv = center_empty.matrix_world.inverted()
         for ob in self.value:
-            set_parent_and_keep_mx(ob, center_empty)
+            set_parent_and_keep_mx(ob, center_empty, center_empty_mx_inv)
 
     def refresh(self) -> None:
         self._set_count()
@@ -349,27 +448,37 @@ class RadialDuplicatesPivotPoint:
 
         return center_empty.matrix_world.to_translation()
 
+    def _get_origin_co_world(self) -> Vector:
+        return self._radial_duplicates.starting_object.value.matrix_world.to_translation()
+
+    def _get_cursor_co_world(self) -> Vector:
+        return Vector(self._radial_duplicates.context.scene.cursor.location.copy())
+
+    def _get_mesh_selection_co_world(self) -> Vector:
+        return get_mesh_selection_co_world(self._radial_duplicates.context)
+
+    def _get_active_object_co_world(self) -> Vector:
+        return self._radial_duplicates.context.view_layer.objects.active.matrix_world.to_translation()
+
+    def _get_center_empty_co_world(self) -> Vector:
+        return self._radial_duplicates.center_empty.value.matrix_world.to_translation()
+
+    _POINT_CO_GETTERS = {
+        'ORIGIN': _get_origin_co_world,
+        'CURSOR': _get_cursor_co_world,
+        'MESH_SELECTION': _get_mesh_selection_co_world,
+        'ACTIVE_OBJECT': _get_active_object_co_world,
+        'CENTER_EMPTY': _get_center_empty_co_world,
+    }
+
     def _get_point_co_world(self, point: Union[str, Vector]) -> Vector:
         """Get point coordinates.
 
-        :param point: Point in ['ORIGIN', 'CURSOR', 'MESH_SELECTION', 'ACTIVE_OBJECT', 'Vector'].
+        :param point: Point in ['ORIGIN', 'CURSOR', 'MESH_SELECTION', 'ACTIVE_OBJECT', 'CENTER_EMPTY', 'Vector'].
         """
-        context = self._radial_duplicates.context
-        starting_ob = self._radial_duplicates.starting_object.value
-        center_empty = self._radial_duplicates.center_empty.value
-
-        if point == 'ORIGIN':
-            return starting_ob.matrix_world.to_translation()
-        elif point == 'CURSOR':
-            return Vector(context.scene.cursor.location.copy())
-        elif point == 'MESH_SELECTION':
-            return get_mesh_selection_co_world(context)
-        elif point == 'ACTIVE_OBJECT':
-            return context.view_layer.objects.active.matrix_world.to_translation()
-        elif point == 'CENTER_EMPTY':
-            return center_empty.matrix_world.to_translation()
-        else:
-            return point
+        # vectors are not hashable, so only look up strings
+        get_co = self._POINT_CO_GETTERS.get(point) if isinstance(point, str) else None
+        return get_co(self) if get_co is not None else point
 
     def set(self, point: Union[str, Vector]) -> None:
         """Change pivot point location.
@@ -1,4 +1,3 @@
-import re
 from typing import Optional
 
 import bpy
@@ -8,13 +7,18 @@ from bpy.types import Context
 from bpy.types import NodesModifier
 from bpy.types import NodeTree
 from bpy.types import Object
-from mathutils import Matrix
 from mathutils import Vector
 
 from .. import properties
 from ..utils.object import copy_collections
 from ..utils.object import copy_local_view_state
+from ..utils.math import AXIS_INDEX
+from ..utils.math import get_rotation_pivot_co
 from ..utils.object import get_modifier_index
+from ..utils.object import split_name_index
+
+_SCRATCH16 = np.empty(16, dtype=np.float32)
+_NODE_GROUP_TEMPLATE_NAME = ".RadialScrewNodesTemplate"
 
 
 def find_screw_mod(ob: Object, name: str) -> Optional[ScrewModifier]:
@@ -23,14 +27,10 @@ def find_screw_mod(ob: Object, name: str) -> Optional[ScrewModifier]:
     return screw_mod
 
 
-def find_nodes_mod(ob: Object, name: str) -> Optional[NodesModifier]:
-    """Find nodes modifier by name."""
-    match = re.search(r"\.[0-9]+$", name)
-    index = "" if match is None else match.group(0)
-    base_name = name.removesuffix(index)
-    nodes_mods = filter(lambda mod: mod.type == 'NODES' and mod.name == f"{base_name}Offset{index}", ob.modifiers)
-    nodes_mod = next(nodes_mods, None)
-    return nodes_mod
+def find_nodes_mod(ob: Object, base_name: str, index: str) -> Optional[NodesModifier]:
+    """Find nodes modifier by base name and numeric suffix of its screw modifier."""
+    nodes_mod = ob.modifiers.get(f"{base_name}Offset{index}")
+    return nodes_mod if nodes_mod is not None and nodes_mod.type == 'NODES' else None
 
 
 def find_axis_empty(screw_mod: ScrewModifier) -> Optional[Object]:
@@ -59,24 +59,37 @@ def new_screw_mod(context: Context, ob: Object) -> ScrewModifier:
 
 
 def new_nodes_mod(
-    ob: Object, screw_mod: ScrewModifier, props: "properties.RadialScrewPropsGroup", name: str
+    ob: Object, screw_mod: ScrewModifier, props: "properties.RadialScrewPropsGroup", base_name: str, index: str
 ) -> NodesModifier:
     """Add new nodes modifier to object and sort it."""
-    match = re.search(r"\.[0-9]+$", name)
-    index = "" if match is None else match.group(0)
-    base_name = screw_mod.name.removesuffix(index)
     # noinspection PyTypeChecker
     nodes_mod: NodesModifier = ob.modifiers.new(name=f"{base_name}Offset{index}", type='NODES')
     nodes_mod.node_group = new_node_group()
     nodes_mod.show_expanded = False
     nodes_mod.show_viewport = props.show_viewport
-    sort_nodes_mod(ob, nodes_mod, screw_mod)
+    # new modifier is always appended to the end of the stack
+    sort_nodes_mod(ob, nodes_mod, screw_mod, nodes_mod_idx=len(ob.modifiers) - 1)
     return nodes_mod
 
 
 def new_node_group() -> NodeTree:
-    """Add a new node group and return it."""
-    node_group = bpy.data.node_groups.new(name="RadialScrewNodes", type='GeometryNodeTree')
+    """Add a new node group and return it.
+
+    Node group is copied from a template, which is built on first use.
+    Template has no users, so it isn't saved with the file. It's looked up by name,
+    so it's rebuilt if it has been purged or another file has been loaded.
+    """
+    template = bpy.data.node_groups.get(_NODE_GROUP_TEMPLATE_NAME)
+    if template is None:
+        template = _build_node_group(_NODE_GROUP_TEMPLATE_NAME)
+    node_group = template.copy()
+    node_group.name = "RadialScrewNodes"
+    return node_group
+
+
+def _build_node_group(name: str) -> NodeTree:
+    """Build a new node group node by node and return it."""
+    node_group = bpy.data.node_groups.new(name=name, type='GeometryNodeTree')
 
     group_input = node_group.nodes.new(type='NodeGroupInput')
     group_output = node_group.nodes.new(type='NodeGroupOutput')
@@ -114,8 +127,12 @@ def new_props(ob: Object, screw_mod: ScrewModifier, name: str) -> "properties.Ra
     """Add a new radial screw property group and return it."""
     props = ob.radial_duplicator.screws.add()
     props["name"] = name
-    mx = ob.matrix_world.inverted()
-    props["spin_orientation_matrix_object"] = np.array(mx).ravel()
+    # Orientation is consumed as ob.matrix_world @ orientation, both for the spin axis and for the whole
+    # axis empty matrix, so the inverse is stored to start from global orientation.
+    # Matrix rows are written straight to the float32 buffer, property assignment copies the data,
+    # so the same buffer is reused for every build.
+    _SCRATCH16.reshape(4, 4)[:] = ob.matrix_world.inverted()
+    props["spin_orientation_matrix_object"] = _SCRATCH16
     props["show_viewport"] = screw_mod.show_viewport
     return props
 
@@ -124,16 +141,18 @@ def new_axis_empty(context: Context, ob: Object, screw_mod: ScrewModifier) -> Ob
     """Add a new center empty to property group and return it."""
     axis_empty = bpy.data.objects.new(name="ScrewEmpty", object_data=None)
     axis_empty.empty_display_type = 'SPHERE'
-    axis_empty.empty_display_size = max(ob.dimensions) / 2
+    dimensions = ob.dimensions
+    axis_empty.empty_display_size = max(dimensions.x, dimensions.y, dimensions.z) / 2
     copy_collections(ob, axis_empty)
     copy_local_view_state(context, axis_empty)
     if ob.type != 'CURVE':
         # center_empty.hide_viewport = True
+        # Parent inverse and basis matrices of the newly created object are identity,
+        # and assigning parent doesn't change them, so the empty lands on the object origin.
         axis_empty.parent = ob
-        # matrix_world of the newly created object updates after updating depsgraph
+        # matrix_world of the newly created object updates after updating depsgraph,
+        # it's read right after building, when the pivot point is set
         context.evaluated_depsgraph_get().update()
-        axis_empty.matrix_parent_inverse.identity()
-        axis_empty.matrix_basis.identity()
     else:
         # modifier will lag if its empty set to ob child
         axis_empty.matrix_world = ob.matrix_world
@@ -143,38 +162,63 @@ def new_axis_empty(context: Context, ob: Object, screw_mod: ScrewModifier) -> Ob
 
 def sort_screw_mod(ob: Object, screw_mod: ScrewModifier) -> None:
     """Place screw modifier after mirror, screw or on the top."""
-    screw_mod_idx = ob.modifiers.find(screw_mod.name)
-    other_mods = [mod for mod in ob.modifiers if mod != screw_mod]
-
-    another_screw_mods = filter(lambda mod: mod.type == 'SCREW', reversed(other_mods))
-    another_screw_mod = next(another_screw_mods, None)
-    if another_screw_mod is not None:
-        another_screw_mod_idx = ob.modifiers.find(another_screw_mod.name)
+    # find indices of the screw modifier, the last other screw and the last unanchored mirror in a single walk
+    screw_mod_idx = None
+    another_screw_mod_idx = None
+    mirror_mod_idx = None
+    modifiers = ob.modifiers
+    for idx in range(len(modifiers) - 1, -1, -1):
+        mod = modifiers[idx]
+        if mod == screw_mod:
+            screw_mod_idx = idx
+            continue
+
+        mod_type = mod.type
+        if mod_type == 'SCREW':
+            if another_screw_mod_idx is None:
+                another_screw_mod_idx = idx
+        elif mod_type == 'MIRROR' and mirror_mod_idx is None and mod.mirror_object is None:
+            mirror_mod_idx = idx
+
+        if screw_mod_idx is not None and another_screw_mod_idx is not None:
+            break
+
+    if another_screw_mod_idx is not None:
         new_screw_mod_idx = get_modifier_index(current_index=screw_mod_idx,
                                                reference_index=another_screw_mod_idx,
                                                position='AFTER')
+    elif mirror_mod_idx is not None:
+        new_screw_mod_idx = get_modifier_index(current_index=screw_mod_idx,
+                                               reference_index=mirror_mod_idx,
+                                               position='AFTER')
     else:
-        mirror_mods = filter(lambda mod: mod.type == 'MIRROR' and mod.mirror_object is None, reversed(other_mods))
-        mirror_mod = next(mirror_mods, None)
-        if mirror_mod is not None:
-            mirror_mod_idx = ob.modifiers.find(mirror_mod.name)
-            new_screw_mod_idx = get_modifier_index(current_index=screw_mod_idx,
-                                                   reference_index=mirror_mod_idx,
-                                                   position='AFTER')
-        else:
-            new_screw_mod_idx = 0
-
-    ob.modifiers.move(from_index=screw_mod_idx, to_index=new_screw_mod_idx)
-
-
-def sort_nodes_mod(ob: Object, nodes_mod: NodesModifier, screw_mod: ScrewModifier) -> None:
-    """Place nodes modifier before screw modifier."""
-    nodes_mod_idx = ob.modifiers.find(nodes_mod.name)
-    screw_mod_idx = ob.modifiers.find(screw_mod.name)
+        new_screw_mod_idx = 0
+
+    # skip no-op move, it would still tag the modifier stack for update
+    if new_screw_mod_idx != screw_mod_idx:
+        modifiers.move(from_index=screw_mod_idx, to_index=new_screw_mod_idx)
+
+
+def sort_nodes_mod(
+    ob: Object,
+    nodes_mod: NodesModifier,
+    screw_mod: ScrewModifier,
+    nodes_mod_idx: Optional[int] = None,
+    screw_mod_idx: Optional[int] = None,
+) -> None:
+    """Place nodes modifier before screw modifier.
+
+    Modifier indices are looked up if they aren't provided.
+    """
+    if nodes_mod_idx is None:
+        nodes_mod_idx = ob.modifiers.find(nodes_mod.name)
+    if screw_mod_idx is None:
+        screw_mod_idx = ob.modifiers.find(screw_mod.name)
     new_nodes_mod_idx = get_modifier_index(current_index=nodes_mod_idx,
                                            reference_index=screw_mod_idx,
                                            position='BEFORE')
-    ob.modifiers.move(from_index=nodes_mod_idx, to_index=new_nodes_mod_idx)
+    if new_nodes_mod_idx != nodes_mod_idx:
+        ob.modifiers.move(from_index=nodes_mod_idx, to_index=new_nodes_mod_idx)
 
 
 def restore_props(
@@ -186,8 +230,8 @@ def restore_props(
     and replace them in radial screw properties. Assume that screw was rotated in local orientation.
     """
     if axis_empty is not None:
-        spin_axis_enums = props.bl_rna.properties["spin_axis"].enum_items
-        props["spin_axis"] = spin_axis_enums.find(get_spin_axis(ob, axis_empty))
+        # write enum item value as id property
+        props["spin_axis"] = AXIS_INDEX[get_spin_axis(ob, axis_empty)]
     props["steps"] = screw_mod.steps
     props["end_angle"] = screw_mod.angle
     props["screw_offset"] = screw_mod.screw_offset
@@ -205,8 +249,8 @@ def get_spin_axis(ob: Object, offset_empty: Object) -> str:
     ob_rot = ob.matrix_world.to_quaternion()
     offset_empty_rot = offset_empty.matrix_world.to_quaternion()
     vec = ob_rot.rotation_difference(offset_empty_rot).to_axis_angle()[0]
-    max_axis = [vec[0], vec[1], vec[2]].index(max([vec[0], vec[1], vec[2]]))
-    spin_axis = {0: "X", 1: "Y", 2: "Z"}[max_axis]
+    # rotation around negative axis is still rotation around that axis
+    spin_axis = "XYZ"[int(np.argmax(np.abs(vec)))]
     return spin_axis
 
 
@@ -218,19 +262,19 @@ def get_pivot_co(ob: Object, offset_empty: Object) -> Vector:
     Return one of the points lying on the spin axis.
     """
     transform_mx = offset_empty.matrix_world @ ob.matrix_world.inverted()
-    a = Matrix.Identity(3) - transform_mx.to_3x3().normalized()
-    b = transform_mx.to_translation()
-    pivot_co = Vector(np.linalg.lstsq(a, b, rcond=None)[0])
+    pivot_co = get_rotation_pivot_co(transform_mx)
     return pivot_co
 
 
 def remove_junk_props(ob: Object) -> None:
     """Remove radial screw properties with name that have no matching screw modifier."""
-    for props in reversed(ob.radial_duplicator.screws):
-        mod = ob.modifiers.get(props.name)
-        if mod is None or mod.type != 'SCREW' or "Radial" not in mod.name:
-            index = ob.radial_duplicator.screws.find(props.name)
-            ob.radial_duplicator.screws.remove(index)
+    # walk the modifier stack once instead of looking up modifier of each property group
+    radial_screw_names = {mod.name for mod in ob.modifiers if mod.type == 'SCREW' and "Radial" in mod.name}
+    screws = ob.radial_duplicator.screws
+    # removing from the end keeps indices of the remaining property groups valid
+    for index in range(len(screws) - 1, -1, -1):
+        if screws[index].name not in radial_screw_names:
+            screws.remove(index)
 
 
 def fix_nodes_mod(
@@ -270,7 +314,7 @@ class ExistingRadialScrewBuilder:
 
     @staticmethod
     def get_nodes_mod(ob: Object, screw_mod: Optional[ScrewModifier], name: str) -> Optional[NodesModifier]:
-        return None if screw_mod is None else find_nodes_mod(ob, name)
+        return None if screw_mod is None else find_nodes_mod(ob, *split_name_index(name))
 
 
 class NewRadialScrewBuilder:
@@ -295,7 +339,7 @@ class NewRadialScrewBuilder:
 
     @staticmethod
     def get_nodes_mod(ob: Object, name: str) -> Optional[NodesModifier]:
-        return find_nodes_mod(ob, name)
+        return find_nodes_mod(ob, *split_name_index(name))
 
 
 class RadialScrewDirector:
@@ -1,9 +1,10 @@
-from typing import Union, Optional
+from typing import NamedTuple, Union, Optional
 
 import bpy
 import numpy as np
 from bpy.types import ScrewModifier
 from bpy.types import Context
+from bpy.types import Node
 from bpy.types import NodesModifier
 from bpy.types import Object
 from mathutils import Euler
@@ -16,34 +17,72 @@ from ..utils.object import clear_children_parent_and_keep_mx
 from ..utils.object import get_normal_matrix
 from ..utils.object import set_children_parent_and_keep_mx
 from ..utils.object import set_origin
-from ..utils.object_data import get_mesh_center_co_world
+from ..utils.object import split_name_index
+from ..utils.object_data import get_mesh_center_co_local
 from ..utils.object_data import get_mesh_selection_co_world
 from ..radial_objects.radial_screw_builder import new_nodes_mod
 from ..radial_objects.radial_screw_builder import RadialScrewDirector
 
 
+# column-major view of the buffer, matrix properties are stored in column-major order
+_SCRATCH16 = np.empty(16, dtype=np.float32)
+_SCRATCH16_COLUMNS = _SCRATCH16.reshape(4, 4, order='F')
+
+
+class _RefreshCtx(NamedTuple):
+    """Values shared by all parts of a radial screw during a single refresh."""
+    mx_world: Matrix
+    mx_world_inv: Matrix
+    props_value: "properties.RadialScrewPropsGroup"
+
+
+def _set_input_value(node: Node, name: str, value: tuple[float, float, float]) -> None:
+    """Set default value of node input if it differs.
+
+    Every write tags the depsgraph. Values come from mathutils, which has the same float precision as sockets,
+    so unchanged values compare equal.
+    """
+    socket = node.inputs[name]
+    if socket.default_value[:] != value:
+        socket.default_value = value
+
+
 class ObjectRadialScrews:
     """Class for getting or controlling RadialScrews on object"""
+    __slots__ = ('context', 'object', 'value', '_name_index', '_mesh_center_co_local')
+
     def __init__(self, context: Context, ob: Object):
         self.context: Context = context
         self.object: Object = ob
         self.value: list["RadialScrew"] = self._get_radial_screws()
+        self._name_index: Optional[dict[str, int]] = None
+        self._mesh_center_co_local: Optional[Vector] = None
 
     def _get_radial_screws(self) -> list["RadialScrew"]:
-        ob_mods = self.object.modifiers
-        radial_screw_modifier_names = [mod.name for mod in ob_mods if mod.type == 'SCREW' and "Radial" in mod.name]
-        radial_screws = [RadialScrew.from_modifier(self, name) for name in radial_screw_modifier_names]
-        return radial_screws
+        # Collect names first, building radial screw can add and move modifiers of the object.
+        radial_screw_modifier_names = []
+        for mod in self.object.modifiers:
+            if mod.type == 'SCREW':
+                name = mod.name
+                if "Radial" in name:
+                    radial_screw_modifier_names.append(name)
+        return [RadialScrew.from_modifier(self, name) for name in radial_screw_modifier_names]
+
+    def _get_name_index(self) -> dict[str, int]:
+        """Get radial screw positions by their names, building them if they are outdated."""
+        if self._name_index is None:
+            self._name_index = {radial_screw.name: i for i, radial_screw in enumerate(self.value)}
+        return self._name_index
+
+    def invalidate_name_index(self) -> None:
+        """Mark radial screw positions by names as outdated, after radial screws were removed."""
+        self._name_index = None
 
     def __getitem__(self, key: Union[str, int]) -> Optional["RadialScrew"]:
         """Get radial screw from class dict or create it from modifier and add to class dict."""
         if type(key) is str:
-            names = [radial_screw.name for radial_screw in self.value]
-            if key in names:
-                i = names.index(key)
-                radial_screw = self.value[i]
-            else:
-                radial_screw = None
+            i = self._get_name_index().get(key)
+            radial_screw = self.value[i] if i is not None else None
 
         elif type(key) is int:
             # https://stackoverflow.com/questions/2492087/how-to-get-the-nth-element-of-a-python-list-or-a-default-if-not-available # noqa
@@ -57,20 +96,49 @@ class ObjectRadialScrews:
 
         return radial_screw
 
+    def index(self, radial_screw: "RadialScrew") -> int:
+        """Get position of radial screw in object modifier stack order."""
+        return self._get_name_index()[radial_screw.name]
+
     def new(self) -> "RadialScrew":
         """Build new radial screw and store it in class dict."""
         radial_screw = RadialScrew.new(self)
 
         self.value.append(radial_screw)
+        # appending doesn't shift other positions
+        if self._name_index is not None:
+            self._name_index[radial_screw.name] = len(self.value) - 1
         return radial_screw
 
+    def get_mesh_center_co_world(self) -> Vector:
+        """Get world space coordinates of object mesh center.
+
+        Mesh isn't edited while radial screws are modified, so its center is calculated once
+        and transformed by the current object matrix. Setting object origin resets it.
+        """
+        if self._mesh_center_co_local is None:
+            self._mesh_center_co_local = get_mesh_center_co_local(self.object)
+        return self.object.matrix_world @ self._mesh_center_co_local
+
+    def invalidate_mesh_center(self) -> None:
+        """Mark calculated mesh center as outdated, after object mesh was moved."""
+        self._mesh_center_co_local = None
+
     def refresh_all(self) -> None:
         """Refresh all object radial screws."""
+        # Radial screws share the object, so its matrix is inverted once for all of them.
+        mx_world = self.object.matrix_world.copy()
+        mx_world_inv = mx_world.inverted()
         for radial_screw in self.value:
-            radial_screw.refresh()
+            radial_screw.refresh(mx_world, mx_world_inv)
 
 
 class RadialScrew:
+    __slots__ = (
+        'siblings', 'name', 'context', 'object',
+        'properties', 'screw_modifier', 'nodes_modifier', 'axis_empty', 'pivot_point',
+    )
+
     @classmethod
     def from_modifier(cls, object_radial_screws: ObjectRadialScrews, screw_modifier_name: str = ""):
         return RadialScrewDirector(cls, object_radial_screws).build_from_modifier(screw_modifier_name)
@@ -100,17 +168,19 @@ class RadialScrew:
     @property
     def spin_vec_object(self):
         ob = self.object
-        props = self.properties
+        props = self.properties.value
 
         # Get new spin orientation from operator attributes on properties update,
         # but use last spin orientation for refreshing.
         # Last orientation is stored in object space.
         # Storing it in global space wouldn't allow radial screw to be properly
         # restored if object has been rotated since then.
-        spin_orientation_matrix_world = ob.matrix_world @ props.value.spin_orientation_matrix_object
-        spin_axis = props.value.spin_axis
-        spin_vec_world = get_axis_vec(spin_axis, spin_orientation_matrix_world)
-        spin_vec_object = spin_vec_world @ ob.matrix_world
+        # Axis of world orientation is the stored axis rotated by the object matrix,
+        # so the whole orientation matrix isn't built to read one column of it.
+        mx_world = ob.matrix_world
+        spin_axis = props.spin_axis
+        spin_vec_world = mx_world.to_3x3() @ get_axis_vec(spin_axis, props.spin_orientation_matrix_object)
+        spin_vec_object = spin_vec_world @ mx_world
 
         return spin_vec_object
 
@@ -146,12 +216,21 @@ class RadialScrew:
         else:
             self.refresh()
 
-    def refresh(self) -> None:
-        """Spin radial screw not changing its parameters."""
+    def refresh(self, mx_world: Optional[Matrix] = None, mx_world_inv: Optional[Matrix] = None) -> None:
+        """Spin radial screw not changing its parameters.
+
+        :param mx_world: Object world matrix, if it's already known.
+        :param mx_world_inv: Inverted object world matrix, if it's already known.
+        """
+        if mx_world is None or mx_world_inv is None:
+            mx_world = self.object.matrix_world
+            mx_world_inv = mx_world.inverted()
+        # property group is looked up by name, so retrieve it once for all parts
+        ctx = _RefreshCtx(mx_world, mx_world_inv, self.properties.value)
         if self.object.type == 'MESH':
-            self.nodes_modifier.refresh()
-        self.screw_modifier.refresh()
-        self.axis_empty.refresh()
+            self.nodes_modifier.refresh(ctx)
+        self.screw_modifier.refresh(ctx)
+        self.axis_empty.refresh(ctx)
 
     def set_pivot_point(self, point: Union[str, Vector]) -> None:
         """Set pivot point and refresh radial screw.
@@ -166,8 +245,7 @@ class RadialScrew:
         self.properties.remove()
         self.nodes_modifier.apply()
         success_msg = self.screw_modifier.apply()
-        self.axis_empty.remove()
-        self.siblings.value.remove(self)
+        self._detach_from_siblings()
         return success_msg
 
     def remove(self) -> None:
@@ -176,11 +254,17 @@ class RadialScrew:
         self.properties.remove()
         self.nodes_modifier.remove()
         self.screw_modifier.remove()
-        self.axis_empty.remove()
+        self._detach_from_siblings()
+
+    def _detach_from_siblings(self) -> None:
+        """Remove radial screw from object radial screws."""
         self.siblings.value.remove(self)
+        self.siblings.invalidate_name_index()
 
 
 class RadialScrewProps:
+    __slots__ = ('_radial_screw',)
+
     def __init__(self, radial_screw: RadialScrew):
         self._radial_screw = radial_screw
 
@@ -203,12 +287,16 @@ class RadialScrewProps:
         context = self._radial_screw.context
         ob = self._radial_screw.object
 
-        return {
-            'GLOBAL': lambda: Matrix.Identity(4),
-            'LOCAL': lambda: ob.matrix_world.copy(),
-            'VIEW': lambda: context.space_data.region_3d.view_matrix.inverted(),
-            'NORMAL': lambda: get_normal_matrix(context, ob),
-        }[spin_orientation]()
+        if spin_orientation == 'GLOBAL':
+            return Matrix.Identity(4)
+        elif spin_orientation == 'LOCAL':
+            return ob.matrix_world.copy()
+        elif spin_orientation == 'VIEW':
+            return context.space_data.region_3d.view_matrix.inverted()
+        elif spin_orientation == 'NORMAL':
+            return get_normal_matrix(context, ob)
+        else:
+            raise KeyError(spin_orientation)
 
     def update(self,
                spin_orientation: str,
@@ -221,22 +309,26 @@ class RadialScrewProps:
                iterations: int) -> None:
         """Update property group."""
         ob = self._radial_screw.object
+        # property group is looked up by name on every access
+        value = self.value
 
-        spin_orientation_enums = self.value.bl_rna.properties["spin_orientation"].enum_items
-        self.value["spin_orientation"] = spin_orientation_enums.find(spin_orientation)
+        spin_orientation_enums = value.bl_rna.properties["spin_orientation"].enum_items
+        value["spin_orientation"] = spin_orientation_enums.find(spin_orientation)
         spin_orientation_matrix = self._get_spin_orientation_matrix(spin_orientation)
         spin_orientation_matrix_object = ob.matrix_world.inverted() @ spin_orientation_matrix
 
-        # noinspection PyTypeChecker
-        self.value["spin_orientation_matrix_object"] = np.array(spin_orientation_matrix_object).T.ravel()
-        spin_axis_enums = self.value.bl_rna.properties["spin_axis"].enum_items
-        self.value["spin_axis"] = spin_axis_enums.find(spin_axis)
-        self.value["steps"] = steps
-        self.value["radius_offset"] = radius_offset
-        self.value["start_angle"] = start_angle
-        self.value["end_angle"] = end_angle
-        self.value["screw_offset"] = screw_offset
-        self.value["iterations"] = iterations
+        # Matrix rows are written straight to the float32 buffer, property assignment copies the data,
+        # so the same buffer is reused for every update.
+        _SCRATCH16_COLUMNS[:] = spin_orientation_matrix_object
+        value["spin_orientation_matrix_object"] = _SCRATCH16
+        spin_axis_enums = value.bl_rna.properties["spin_axis"].enum_items
+        value["spin_axis"] = spin_axis_enums.find(spin_axis)
+        value["steps"] = steps
+        value["radius_offset"] = radius_offset
+        value["start_angle"] = start_angle
+        value["end_angle"] = end_angle
+        value["screw_offset"] = screw_offset
+        value["iterations"] = iterations
 
     def remove(self) -> None:
         """Remove property group if it exists."""
@@ -249,12 +341,14 @@ class RadialScrewProps:
 
 
 class RadialScrewScrewMod:
+    __slots__ = ('_radial_screw', 'value')
+
     def __init__(self, radial_screw: RadialScrew, value: ScrewModifier):
         self._radial_screw = radial_screw
         self.value = value
 
-    def refresh(self) -> None:
-        props = self._radial_screw.properties.value
+    def refresh(self, ctx: _RefreshCtx) -> None:
+        props = ctx.props_value
         axis_empty = self._radial_screw.axis_empty.value
 
         self.value.steps = props.steps
@@ -289,24 +383,26 @@ class RadialScrewScrewMod:
 
 
 class RadialScrewNodesMod:
+    __slots__ = ('_radial_screw', 'value')
+
     def __init__(self, radial_screw: RadialScrew, value: Optional[NodesModifier]):
         self._radial_screw = radial_screw
         self.value = value
 
-    @property
-    def displace_offset_vec_object(self) -> Vector:
+    def _get_displace_offset_vec_object(
+        self, radius_offset: float, spin_vec_object: Vector, mx_world_inv: Matrix
+    ) -> Vector:
         """Get displace vector in ob space."""
-        ob = self._radial_screw.object
-        props = self._radial_screw.properties.value
-        pivot_point_co = self._radial_screw.pivot_point.co_world
-        spin_vec_object = self._radial_screw.spin_vec_object
-
-        if props.radius_offset == 0:
+        if radius_offset == 0:
             return Vector((0, 0, 0))
         else:
-            pivot_mx = ob.matrix_world.copy()
-            pivot_mx.translation = pivot_point_co
-            mesh_center_co_pivot = pivot_mx.inverted() @ get_mesh_center_co_world(ob)
+            # pivot point is only needed for displacement
+            pivot_point_co = self._radial_screw.pivot_point.co_world
+
+            # Pivot matrix differs from object matrix only by translation, so its inverse is
+            # the inverted object rotation and scale applied to the offset from the pivot point.
+            mesh_center_co_world = self._radial_screw.siblings.get_mesh_center_co_world()
+            mesh_center_co_pivot = mx_world_inv.to_3x3() @ (mesh_center_co_world - pivot_point_co)
 
             non_aligned_displace_vec = (
                 Vector((1, 1, 1)) if mesh_center_co_pivot.length_squared < 0.001 else mesh_center_co_pivot
@@ -316,25 +412,44 @@ class RadialScrewNodesMod:
             rejection = non_aligned_displace_vec - projection
 
             aligned_displace_vec_local = rejection.normalized()
-            displace_offset_vec = aligned_displace_vec_local * props.radius_offset
+            displace_offset_vec = aligned_displace_vec_local * radius_offset
             return displace_offset_vec
 
-    def _get_start_rotation_matrix(self) -> Euler:
+    @staticmethod
+    def _get_start_rotation_matrix(start_angle: float, spin_vec_object: Vector) -> Euler:
         """Get object rotation to achieve radial screw starting rotation."""
-        props = self._radial_screw.properties.value
-        spin_vec_object = self._radial_screw.spin_vec_object
-
-        # noinspection PyArgumentList
-        return (
-            Euler((0, 0, 0))
-            if props.start_angle == 0
-            else Matrix.Rotation(props.start_angle, 4, spin_vec_object).to_euler()
-        )
+        if start_angle == 0:
+            # noinspection PyArgumentList
+            return Euler((0, 0, 0))
+
+        # Rotation about an object axis is a single euler angle, so building a matrix
+        # and decomposing it is only needed for other axes.
+        x, y, z = spin_vec_object
+        if y == 0 and z == 0 and x != 0:
+            # noinspection PyArgumentList
+            return Euler((start_angle if x > 0 else -start_angle, 0, 0))
+        elif x == 0 and z == 0 and y != 0:
+            # noinspection PyArgumentList
+            return Euler((0, start_angle if y > 0 else -start_angle, 0))
+        elif x == 0 and y == 0 and z != 0:
+            # noinspection PyArgumentList
+            return Euler((0, 0, start_angle if z > 0 else -start_angle))
+        return Matrix.Rotation(start_angle, 4, spin_vec_object).to_euler()
+
+    def refresh(self, ctx: _RefreshCtx) -> None:
+        props = ctx.props_value
+        start_angle = props.start_angle
+        radius_offset = props.radius_offset
+        # nothing to rotate or displace, so don't build rotation and projection just to find it out
+        if start_angle == 0 and radius_offset == 0:
+            self.remove()
+            return
 
-    def refresh(self) -> None:
-        start_rotation = self._get_start_rotation_matrix()
-        displace_offset_vec = self.displace_offset_vec_object
-        ob = self._radial_screw.object
+        mx_world_inv = ctx.mx_world_inv
+        # spin vector is shared by start rotation and displacement
+        spin_vec_object = self._radial_screw.spin_vec_object
+        start_rotation = self._get_start_rotation_matrix(start_angle, spin_vec_object)
+        displace_offset_vec = self._get_displace_offset_vec_object(radius_offset, spin_vec_object, mx_world_inv)
         axis_empty = self._radial_screw.axis_empty.value
 
         if start_rotation[:] != (0, 0, 0) or displace_offset_vec[:] != (0, 0, 0):
@@ -342,20 +457,16 @@ class RadialScrewNodesMod:
             if self.value is None:
                 self.add()
 
-            node_group = self.value.node_group
-            node = node_group.nodes["StartRotation"]
-            node.inputs["Rotation"].default_value = start_rotation[:]
-            node = node_group.nodes["RadiusOffset"]
-            node.inputs["Translation"].default_value = displace_offset_vec[:]
+            nodes = self.value.node_group.nodes
+            _set_input_value(nodes["StartRotation"], "Rotation", start_rotation[:])
+            _set_input_value(nodes["RadiusOffset"], "Translation", displace_offset_vec[:])
 
             axis_empty_mx = axis_empty.matrix_world
-            axis_empty_mx_ob = ob.matrix_world.inverted() @ axis_empty_mx
-
-            node = node_group.nodes["ObjectPivotToRadialScrewCenter"]
-            node.inputs["Translation"].default_value = axis_empty_mx_ob.inverted().to_translation()
+            axis_empty_mx_ob = mx_world_inv @ axis_empty_mx
 
-            node = node_group.nodes["RestoreObjectPivot"]
-            node.inputs["Translation"].default_value = axis_empty_mx_ob.to_translation()
+            _set_input_value(nodes["ObjectPivotToRadialScrewCenter"], "Translation",
+                             axis_empty_mx_ob.inverted().to_translation()[:])
+            _set_input_value(nodes["RestoreObjectPivot"], "Translation", axis_empty_mx_ob.to_translation()[:])
 
         else:
             self.remove()
@@ -367,7 +478,8 @@ class RadialScrewNodesMod:
         screw_mod = self._radial_screw.screw_modifier.value
         props = self._radial_screw.properties.value
 
-        self.value = new_nodes_mod(ob, screw_mod, props, name)
+        base_name, index = split_name_index(name)
+        self.value = new_nodes_mod(ob, screw_mod, props, base_name, index)
 
     def apply(self) -> None:
         """Apply nodes modifier if it exists."""
@@ -392,23 +504,28 @@ class RadialScrewNodesMod:
 
 
 class RadialScrewAxisEmpty:
+    __slots__ = ('_radial_screw', 'value')
+
     def __init__(self, radial_screw: RadialScrew, value: Optional[Object]):
         self._radial_screw = radial_screw
         self.value = value
 
-    def refresh(self) -> None:
+    def refresh(self, ctx: _RefreshCtx) -> None:
         """Rotate offset empty across pivot point."""
-        ob = self._radial_screw.object
-        props = self._radial_screw.properties.value
         pivot_point_co_world = self._radial_screw.pivot_point.co_world
-        spin_orientation_matrix_world = ob.matrix_world @ props.spin_orientation_matrix_object
+        mx_world = ctx.mx_world @ ctx.props_value.spin_orientation_matrix_object
+        mx_world.translation = pivot_point_co_world
+
+        # Matrix is recalculated from the same values on unrelated props changes,
+        # reparenting children to keep their matrices isn't needed then.
+        if mx_world == self.value.matrix_world:
+            return
 
         # transform
         children = self.value.children
         clear_children_parent_and_keep_mx(self.value)
 
-        self.value.matrix_world = spin_orientation_matrix_world
-        self.value.matrix_world.translation = pivot_point_co_world
+        self.value.matrix_world = mx_world
 
         set_children_parent_and_keep_mx(children, self.value)
 
@@ -421,6 +538,8 @@ class RadialScrewAxisEmpty:
 
 
 class RadialScrewPivotPoint:
+    __slots__ = ('_radial_screw',)
+
     def __init__(self, radial_screw: RadialScrew):
         self._radial_screw = radial_screw
 
@@ -431,27 +550,37 @@ class RadialScrewPivotPoint:
 
         return axis_empty.matrix_world.to_translation()
 
+    def _get_origin_co_world(self) -> Vector:
+        return self._radial_screw.object.matrix_world.to_translation()
+
+    def _get_cursor_co_world(self) -> Vector:
+        return self._radial_screw.context.scene.cursor.location.copy()
+
+    def _get_mesh_selection_co_world(self) -> Vector:
+        return get_mesh_selection_co_world(self._radial_screw.context)
+
+    def _get_active_object_co_world(self) -> Vector:
+        return self._radial_screw.context.view_layer.objects.active.matrix_world.to_translation()
+
+    def _get_axis_empty_co_world(self) -> Vector:
+        return self._radial_screw.axis_empty.value.matrix_world.to_translation()
+
+    _POINT_CO_GETTERS = {
+        'ORIGIN': _get_origin_co_world,
+        'CURSOR': _get_cursor_co_world,
+        'MESH_SELECTION': _get_mesh_selection_co_world,
+        'ACTIVE_OBJECT': _get_active_object_co_world,
+        'AXIS_EMPTY': _get_axis_empty_co_world,
+    }
+
     def _get_point_co_world(self, point: Union[str, Vector]) -> Vector:
         """Get point coordinates.
 
-        :param point: Point in ['ORIGIN', 'CURSOR', 'MESH_SELECTION', 'ACTIVE_OBJECT', 'Vector'].
+        :param point: Point in ['ORIGIN', 'CURSOR', 'MESH_SELECTION', 'ACTIVE_OBJECT', 'AXIS_EMPTY', 'Vector'].
         """
-        context = self._radial_screw.context
-        ob = self._radial_screw.object
-        axis_empty = self._radial_screw.axis_empty.value
-
-        if point == 'ORIGIN':
-            return ob.matrix_world.to_translation()
-        elif point == 'CURSOR':
-            return Vector(context.scene.cursor.location.copy())
-        elif point == 'MESH_SELECTION':
-            return get_mesh_selection_co_world(context)
-        elif point == 'ACTIVE_OBJECT':
-            return context.view_layer.objects.active.matrix_world.to_translation()
-        elif point == 'AXIS_EMPTY':
-            return axis_empty.matrix_world.to_translation()
-        else:
-            return point
+        # vectors are not hashable, so only look up strings
+        get_co = self._POINT_CO_GETTERS.get(point) if isinstance(point, str) else None
+        return get_co(self) if get_co is not None else point
 
     def set(self, point: Union[str, Vector]) -> None:
         """Change pivot point location.
@@ -465,12 +594,14 @@ class RadialScrewPivotPoint:
         point_co = self._get_point_co_world(point)
 
         if siblings.value:
-            if siblings.value[-1] == self._radial_screw:
+            if siblings.value[-1] is self._radial_screw:
                 self._set_top_radial_screw_pivot_point(point_co)
             else:
                 self._set_child_radial_screw_pivot_point(point_co)
         else:
             set_origin(context, ob, point_co)
+            # setting origin moves mesh
+            siblings.invalidate_mesh_center()
 
     def _set_top_radial_screw_pivot_point(self, point_co: Vector) -> None:
         """Set object origin location keeping pivot points of object radial screws and refresh all radial screws."""
@@ -478,12 +609,16 @@ class RadialScrewPivotPoint:
         ob = self._radial_screw.object
         axis_empty = self._radial_screw.axis_empty.value
 
-        if ob.parent == axis_empty:
-            axis_empty.matrix_world.translation = point_co
-            set_origin(context, ob, point_co)
-        else:
-            set_origin(context, ob, point_co)
-            axis_empty.matrix_world.translation = point_co
+        # point may be unchanged, radial screw is refreshed anyway to apply changed properties
+        if not point_co == axis_empty.matrix_world.translation == ob.matrix_world.translation:
+            if ob.parent == axis_empty:
+                axis_empty.matrix_world.translation = point_co
+                set_origin(context, ob, point_co)
+            else:
+                set_origin(context, ob, point_co)
+                axis_empty.matrix_world.translation = point_co
+            # setting origin moves mesh
+            self._radial_screw.siblings.invalidate_mesh_center()
 
         self._radial_screw.refresh()
 
@@ -491,5 +626,6 @@ class RadialScrewPivotPoint:
         """Set center empty location and refresh radial screw."""
         axis_empty = self._radial_screw.axis_empty.value
 
-        axis_empty.matrix_world.translation = point_co
+        if point_co != axis_empty.matrix_world.translation:
+            axis_empty.matrix_world.translation = point_co
         self._radial_screw.refresh()
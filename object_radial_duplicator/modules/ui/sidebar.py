@@ -3,6 +3,24 @@ import bpy
 from ...package import get_preferences
 
 
+_RADIAL_OB_TYPES = frozenset({'MESH', 'EMPTY', 'CURVE', 'SURFACE', 'FONT'})
+
+
+def _get_radial_mods(ob):
+    """Get radial array and radial screw modifiers of object in one pass over its modifiers."""
+    array_mods = []
+    screw_mods = []
+    for mod in ob.modifiers:
+        mod_type = mod.type
+        if mod_type == 'ARRAY':
+            if "Radial" in mod.name:
+                array_mods.append(mod)
+        elif mod_type == 'SCREW':
+            if "Radial" in mod.name:
+                screw_mods.append(mod)
+    return array_mods, screw_mods
+
+
 class RADDUPLCIATOR_PT_sidebar(bpy.types.Panel):
     bl_label = "Radial Duplicator"
     bl_space_type = 'VIEW_3D'
@@ -47,23 +65,22 @@ class RADDUPLCIATOR_PT_sidebar(bpy.types.Panel):
                          icon='CURVE_NCIRCLE').from_button = True
 
         ob = context.object
-        if ob.type in {'MESH', 'EMPTY', 'CURVE', 'SURFACE', 'FONT'}:
-            self.draw_radial_arrays(layout, context)
-        if ob.type in {'MESH', 'EMPTY', 'CURVE', 'SURFACE', 'FONT'}:
-            self.draw_radial_screws(layout, context)
-        if ob.type in {'MESH', 'EMPTY', 'CURVE', 'SURFACE', 'FONT', 'EMPTY'}:
+        if ob.type in _RADIAL_OB_TYPES:
+            array_mods, screw_mods = _get_radial_mods(ob)
+            self.draw_radial_arrays(layout, context, array_mods)
+            self.draw_radial_screws(layout, context, screw_mods)
             self.draw_radial_duplicates(layout, context)
 
-    def draw_radial_arrays(self, layout, context):
+    def draw_radial_arrays(self, layout, context, array_mods):
         ob = context.object
 
-        array_mods = [mod for mod in ob.modifiers if mod.type == 'ARRAY' and "Radial" in mod.name]
         if array_mods:
             col = layout.column(align=True)
+            arrays_props = ob.radial_duplicator.arrays
 
             for array_mod in array_mods:
                 radial_array_name = array_mod.name
-                props = ob.radial_duplicator.arrays.get(radial_array_name)
+                props = arrays_props.get(radial_array_name)
                 box = col.box()
 
                 # Top row
@@ -116,11 +133,13 @@ class RADDUPLCIATOR_PT_sidebar(bpy.types.Panel):
     def draw_radial_duplicates(self, layout, context):
         ob = context.object
 
-        props = None
-        if ob.children is not None and len(ob.radial_duplicator.duplicates) > 0:
-            props = ob.radial_duplicator.duplicates[0]
-        elif ob.parent is not None and len(ob.parent.radial_duplicator.duplicates) > 0:
-            props = ob.parent.radial_duplicator.duplicates[0]
+        # Children are found by scanning all objects and are never None, so they aren't checked.
+        duplicates = ob.radial_duplicator.duplicates
+        if not duplicates:
+            parent = ob.parent
+            if parent is not None:
+                duplicates = parent.radial_duplicator.duplicates
+        props = duplicates[0] if duplicates else None
 
         if props is not None:
             box = layout.box()
@@ -167,16 +186,16 @@ class RADDUPLCIATOR_PT_sidebar(bpy.types.Panel):
                               icon='PIVOT_CURSOR')
             op.pivot_point = 'CURSOR'
 
-    def draw_radial_screws(self, layout, context):
+    def draw_radial_screws(self, layout, context, screw_mods):
         ob = context.object
 
-        screw_mods = [mod for mod in ob.modifiers if mod.type == 'SCREW' and "Radial" in mod.name]
         if screw_mods:
             col = layout.column(align=True)
+            screws_props = ob.radial_duplicator.screws
 
             for screw_mod in screw_mods:
                 radial_screw_name = screw_mod.name
-                props = ob.radial_duplicator.screws.get(radial_screw_name)
+                props = screws_props.get(radial_screw_name)
                 box = col.box()
 
                 # Top row
@@ -1,5 +1,6 @@
 import gpu
 import bpy
+import numpy as np
 from gpu_extras.batch import batch_for_shader
 
 point_shader = gpu.shader.from_builtin('UNIFORM_COLOR')
@@ -8,10 +9,17 @@ segment_shader = gpu.shader.from_builtin('UNIFORM_COLOR')
 
 def redraw_point_shader(context, points):
     dns = bpy.app.driver_namespace
+    # contiguous float32 coordinates are uploaded without converting every vector
+    points = np.ascontiguousarray(points, dtype=np.float32).reshape(-1, 3)
+    # keep drawing the existing batch if points haven't changed
+    data = points.tobytes()
     handler = dns.get("draw_xray_points_debug")
     if handler:
+        if dns.get("draw_xray_points_debug_data") == data:
+            return
         context.space_data.draw_handler_remove(handler, 'WINDOW')
         del bpy.app.driver_namespace['draw_xray_points_debug']
+    dns['draw_xray_points_debug_data'] = data
 
     point_batch = batch_for_shader(point_shader, 'POINTS', {"pos": points})
 
@@ -28,10 +36,16 @@ def draw_point_shader(point_batch):
 
 def redraw_segment_shader(context, points, indices):
     dns = bpy.app.driver_namespace
+    points = np.ascontiguousarray(points, dtype=np.float32).reshape(-1, 3)
+    indices = np.ascontiguousarray(indices, dtype=np.int32).reshape(-1, 2)
+    data = (points.tobytes(), indices.tobytes())
     handler = dns.get("draw_xray_segment_debug")
     if handler:
+        if dns.get("draw_xray_segment_debug_data") == data:
+            return
         context.space_data.draw_handler_remove(handler, 'WINDOW')
         del bpy.app.driver_namespace['draw_xray_segment_debug']
+    dns['draw_xray_segment_debug_data'] = data
 
     segment_batch = batch_for_shader(segment_shader, 'LINES', {"pos": points}, indices=indices)
 
@@ -8,7 +8,9 @@ def redraw_sidebar(context) -> None:
     for area in context.screen.areas:
         for region in area.regions:
             if region.type == "UI":
-                area.tag_redraw()
+                # tag only the sidebar, tagging area would redraw viewport and headers too
+                region.tag_redraw()
+                break
 
 
 def draw_keymap_items(keymap_items: list[KeyMapItem],
@@ -26,7 +28,7 @@ def draw_keymap_items(keymap_items: list[KeyMapItem],
 
     kc = bpy.context.window_manager.keyconfigs.user
     km = kc.keymaps.get(keymap_name)
-    kmi_idnames = [keymap_item.idname for keymap_item in keymap_items]
+    kmi_idnames = {keymap_item.idname for keymap_item in keymap_items}
 
     if allow_removing:
         column.context_pointer_set("keymap", km)
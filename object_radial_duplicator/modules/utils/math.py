@@ -1,7 +1,16 @@
+from math import cos
+from math import isclose
+from math import sin
+from math import sqrt
+from math import tan
+
 import numpy as np
 from mathutils import Matrix
 from mathutils import Vector
 
+# index of axis in vectors and matrix columns, also item value of spin axis enum properties
+AXIS_INDEX = {'X': 0, 'Y': 1, 'Z': 2}
+
 
 def get_axis_vec(axis: str, matrix: Matrix) -> Vector:
     """Get axis vector from matrix.
@@ -9,11 +18,8 @@ def get_axis_vec(axis: str, matrix: Matrix) -> Vector:
     :param axis: Axis in ['X', 'Y', 'Z']
     :param matrix: Matrix
     """
-    return {
-        'X': Vector((matrix[0][0], matrix[1][0], matrix[2][0])),
-        'Y': Vector((matrix[0][1], matrix[1][1], matrix[2][1])),
-        'Z': Vector((matrix[0][2], matrix[1][2], matrix[2][2])),
-    }[axis]
+    i = AXIS_INDEX[axis]
+    return Vector((matrix[0][i], matrix[1][i], matrix[2][i]))
 
 
 def flatten_vec(vec: Vector, axis: str) -> Vector:
@@ -22,23 +28,93 @@ def flatten_vec(vec: Vector, axis: str) -> Vector:
     :param vec: Vector
     :param axis: Axis in ['X', 'Y', 'Z']
     """
-    if axis == 'X':
-        vec[0] = 0
-    elif axis == 'Y':
-        vec[1] = 0
-    elif axis == 'Z':
-        vec[2] = 0
+    i = AXIS_INDEX.get(axis)
+    if i is not None:
+        vec[i] = 0
     return vec
 
 
 def build_circle(radius: float, sides: int) -> np.array:
     """Build a circle and return its vertex coordinates."""
     # https://stackoverflow.com/questions/17258546/opengl-creating-a-circle-change-radius
-    counts = np.arange(1, sides + 1, dtype="f")
-    angles = np.multiply(counts, 2 * np.pi / sides)
-    vert_x = np.multiply(np.sin(angles), radius)
-    vert_y = np.multiply(np.cos(angles), radius)
-    vert_z = np.zeros(sides, "f")
-    vert_co = np.column_stack((vert_x, vert_y, vert_z))
-    vert_co.shape = (sides, 3)
+    angles = np.arange(1, sides + 1, dtype="f")
+    angles *= 2 * np.pi / sides
+    # write coordinates straight to the columns of the result
+    vert_co = np.empty((sides, 3), "f")
+    np.sin(angles, out=vert_co[:, 0])
+    np.cos(angles, out=vert_co[:, 1])
+    vert_co[:, :2] *= radius
+    vert_co[:, 2] = 0
     return vert_co
+
+
+def rotation_about_point(axis_vec: Vector, angle: float, pivot_co: Vector) -> Matrix:
+    """Get matrix of rotation around axis passing through pivot point.
+
+    Same as Translation(pivot) @ Rotation(angle, 4, axis) @ Translation(-pivot), built in one step.
+
+    :param axis_vec: Rotation axis, doesn't have to be normalized.
+    :param angle: Rotation angle in radians.
+    :param pivot_co: Point the rotation axis passes through.
+    """
+    # plain floats until the final matrix, to not allocate mathutils objects on the way
+    x, y, z = axis_vec
+    length = sqrt(x * x + y * y + z * z)
+    if length:
+        x /= length
+        y /= length
+        z /= length
+    px, py, pz = pivot_co
+    c = cos(angle)
+    s = sin(angle)
+    t = 1 - c
+
+    # Rodrigues' rotation formula
+    r00, r01, r02 = t * x * x + c, t * x * y - s * z, t * x * z + s * y
+    r10, r11, r12 = t * x * y + s * z, t * y * y + c, t * y * z - s * x
+    r20, r21, r22 = t * x * z - s * y, t * y * z + s * x, t * z * z + c
+
+    return Matrix((
+        (r00, r01, r02, px - (r00 * px + r01 * py + r02 * pz)),
+        (r10, r11, r12, py - (r10 * px + r11 * py + r12 * pz)),
+        (r20, r21, r22, pz - (r20 * px + r21 * py + r22 * pz)),
+        (0.0, 0.0, 0.0, 1.0),
+    ))
+
+
+def get_rotation_matrices(axis_vec: Vector, angles: np.ndarray) -> np.ndarray:
+    """Get stacked 3x3 matrices of rotations around axis, one per angle.
+
+    :param axis_vec: Rotation axis, doesn't have to be normalized.
+    :param angles: Rotation angles in radians, shape (n,).
+    :return: Rotation matrices, shape (n, 3, 3).
+    """
+    x, y, z = axis_vec.normalized()
+    # cross product matrix of axis
+    k = np.array(((0.0, -z, y), (z, 0.0, -x), (-y, x, 0.0)))
+    sin_a = np.sin(angles)[:, np.newaxis, np.newaxis]
+    cos_a = np.cos(angles)[:, np.newaxis, np.newaxis]
+
+    # Rodrigues' rotation formula
+    return np.identity(3) + sin_a * k + (1 - cos_a) * (k @ k)
+
+
+def get_rotation_pivot_co(transform_mx: Matrix) -> Vector:
+    """Get point on the rotation axis of transform matrix that is closest to the origin.
+
+    :param transform_mx: Matrix of rotation around some point, scale is ignored.
+    :return: Origin if matrix has no rotation.
+    """
+    # to_quaternion normalizes scale itself, so rotation is taken from the matrix without intermediate copies
+    axis, angle = transform_mx.to_quaternion().to_axis_angle()
+    offset = transform_mx.to_translation()
+
+    # The point on the spin axis closest to the origin is the minimum norm solution of
+    # (I - R) @ co = offset, which for rotation R around unit axis by angle has a closed form.
+    tan_half_angle = tan(angle / 2)
+    if isclose(tan_half_angle, 0, abs_tol=1e-6):
+        return Vector((0, 0, 0))
+    # axis is unit length, so projection needs no division by its squared length
+    offset_rejection = offset - axis * offset.dot(axis)
+    pivot_co = (offset_rejection + axis.cross(offset) / tan_half_angle) / 2
+    return pivot_co
@@ -14,53 +14,33 @@ def get_property_default(operator, idname):
     return op_properties[idname].default
 
 
+_EVENT_TYPE_DIGIT = {
+    'ZERO': 0,
+    'ONE': 1,
+    'TWO': 2,
+    'THREE': 3,
+    'FOUR': 4,
+    'FIVE': 5,
+    'SIX': 6,
+    'SEVEN': 7,
+    'EIGHT': 8,
+    'NINE': 9,
+    'NUMPAD_0': 0,
+    'NUMPAD_1': 1,
+    'NUMPAD_2': 2,
+    'NUMPAD_3': 3,
+    'NUMPAD_4': 4,
+    'NUMPAD_5': 5,
+    'NUMPAD_6': 6,
+    'NUMPAD_7': 7,
+    'NUMPAD_8': 8,
+    'NUMPAD_9': 9,
+}
+
+
 def event_type_to_digit(event_type):
-    event_type_digit = {
-        'ZERO': 0,
-        'ONE': 1,
-        'TWO': 2,
-        'THREE': 3,
-        'FOUR': 4,
-        'FIVE': 5,
-        'SIX': 6,
-        'SEVEN': 7,
-        'EIGHT': 8,
-        'NINE': 9,
-        'NUMPAD_0': 0,
-        'NUMPAD_1': 1,
-        'NUMPAD_2': 2,
-        'NUMPAD_3': 3,
-        'NUMPAD_4': 4,
-        'NUMPAD_5': 5,
-        'NUMPAD_6': 6,
-        'NUMPAD_7': 7,
-        'NUMPAD_8': 8,
-        'NUMPAD_9': 9,
-    }
-    return event_type_digit[event_type]
+    return _EVENT_TYPE_DIGIT[event_type]
 
 
 def event_type_is_digit(event_type):
-    digits = {
-        'ZERO',
-        'ONE',
-        'TWO',
-        'THREE',
-        'FOUR',
-        'FIVE',
-        'SIX',
-        'SEVEN',
-        'EIGHT',
-        'NINE',
-        'NUMPAD_0',
-        'NUMPAD_1',
-        'NUMPAD_2',
-        'NUMPAD_3',
-        'NUMPAD_4',
-        'NUMPAD_5',
-        'NUMPAD_6',
-        'NUMPAD_7',
-        'NUMPAD_8',
-        'NUMPAD_9',
-    }
-    return event_type in digits
+    return event_type in _EVENT_TYPE_DIGIT
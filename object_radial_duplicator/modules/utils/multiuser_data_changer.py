@@ -29,10 +29,15 @@ class MultiuserDataChanger:
         self._ob.data = new_data
 
     def link_new_object_data_to_instances(self):
-        instances = [ob for ob in bpy.data.objects if ob.data and ob.data.name == self._old_data_name]
         data_collection = self.get_data_collection()
+        old_data = data_collection[self._old_data_name]
+        new_data = data_collection[self._new_data_name]
+
+        # users of old data are found in one call instead of reading data of every object
+        user_map = bpy.data.user_map(subset=[old_data], value_types={'OBJECT'})
+        instances = user_map.get(old_data, ())
 
         for ob in instances:
-            ob.data = data_collection[self._new_data_name]
+            ob.data = new_data
 
-        data_collection.remove(data_collection[self._old_data_name])
+        data_collection.remove(old_data)
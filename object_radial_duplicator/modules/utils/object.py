@@ -1,4 +1,5 @@
-from typing import Literal
+import re
+from typing import Literal, Optional, Sequence
 
 import bpy
 import bmesh
@@ -9,11 +10,17 @@ from mathutils import Vector
 
 from ..utils.object_data import data_is_selected
 
+_INDEX_RE = re.compile(r"\.[0-9]+$")
+
 
 def get_normal_matrix(context: Context, ob: Object) -> Matrix:
     """Get normal matrix of selection."""
     if ob.mode == 'EDIT' and not data_is_selected(ob.data):
         return ob.matrix_world.copy()
+    elif ob.mode == 'OBJECT' and context.active_object is not None:
+        # In object mode normal orientation is the active object rotation,
+        # so it's read directly instead of creating and deleting an orientation.
+        return context.active_object.matrix_world.to_3x3().normalized().to_4x4()
     else:
         active_slot = context.scene.transform_orientation_slots[0]
         if active_slot.custom_orientation is not None:
@@ -58,26 +65,20 @@ def copy_local_view_state(context: Context, ob: Object) -> None:
 
 def set_origin(context: Context, ob: Object, co_world: Vector) -> None:
     """Set object origin location."""
-    if ob.mode == 'EDIT' and ob.type == 'MESH':
-        co_local = ob.matrix_world.inverted() @ co_world
+    mode = ob.mode
+    ob_type = ob.type
+    if (mode == 'EDIT' and ob_type == 'MESH') or (mode == 'OBJECT' and ob_type in {'CURVE', 'MESH'}):
+        # World matrix is affine, so only its 3x3 part has to be inverted.
+        mx_world = ob.matrix_world
+        co_local = mx_world.to_3x3().inverted() @ (co_world - mx_world.translation)
         transform_mx = Matrix.Translation(-co_local)
 
-        bm = bmesh.from_edit_mesh(ob.data)
-        bm.transform(transform_mx)
-        bmesh.update_edit_mesh(ob.data, loop_triangles=False, destructive=False)
-
-        children = ob.children
-        clear_children_parent_and_keep_mx(ob)
-        ob.matrix_world.translation = co_world
-        set_children_parent_and_keep_mx(children, ob)
-        # for child in ob.children:
-        #     child.matrix_parent_inverse = child.matrix_parent_inverse @ transform_mx
-
-    elif ob.mode == 'OBJECT' and ob.type in {'CURVE', 'MESH'}:
-        co_local = ob.matrix_world.inverted() @ co_world
-        transform_mx = Matrix.Translation(-co_local)
-
-        ob.data.transform(transform_mx)
+        if mode == 'EDIT':
+            bm = bmesh.from_edit_mesh(ob.data)
+            bm.transform(transform_mx)
+            bmesh.update_edit_mesh(ob.data, loop_triangles=False, destructive=False)
+        else:
+            ob.data.transform(transform_mx)
 
         children = ob.children
         clear_children_parent_and_keep_mx(ob)
@@ -113,6 +114,17 @@ def get_modifier_index(current_index: int, reference_index: int, position: Liter
     return new_index
 
 
+def split_name_index(name: str) -> tuple[str, str]:
+    """Split modifier name into base name and numeric suffix, e.g. "RadialArray.001" -> ("RadialArray", ".001")."""
+    # most names have no suffix, so skip matching when the name doesn't end with a digit
+    if not name[-1:].isdigit():
+        return name, ""
+    match = _INDEX_RE.search(name)
+    index = "" if match is None else match.group(0)
+    base_name = name.removesuffix(index)
+    return base_name, index
+
+
 def clear_parent_and_keep_mx(ob: Object) -> None:
     """Clear object parent and keep it transforms."""
     ob_mx = ob.matrix_world.copy()
@@ -120,20 +132,30 @@ def clear_parent_and_keep_mx(ob: Object) -> None:
     ob.matrix_world = ob_mx
 
 
-def clear_children_parent_and_keep_mx(ob: Object) -> None:
-    """Clear object children parent and keep their transforms."""
-    children = ob.children
+def clear_children_parent_and_keep_mx(ob: Object, children: Optional[Sequence[Object]] = None) -> None:
+    """Clear object children parent and keep their transforms.
+
+    :param ob: Parent object.
+    :param children: Object children if they are already known, to skip looking them up again.
+    """
+    if children is None:
+        children = ob.children
     if children is not None:
         for child in children:
             clear_parent_and_keep_mx(child)
 
 
-def set_parent_and_keep_mx(ob: Object, parent: Object) -> None:
-    """Set object parent and keep it transforms."""
+def set_parent_and_keep_mx(ob: Object, parent: Object, parent_mx_inv: Optional[Matrix] = None) -> None:
+    """Set object parent and keep it transforms.
+
+    :param ob: Child object.
+    :param parent: Parent object.
+    :param parent_mx_inv: Inverted parent world matrix if it's already known, to skip inverting it again.
+    """
     if ob.parent is not None:
         clear_parent_and_keep_mx(ob)
     ob.parent = parent
-    ob.matrix_parent_inverse = parent.matrix_world.inverted()
+    ob.matrix_parent_inverse = parent.matrix_world.inverted() if parent_mx_inv is None else parent_mx_inv
 
 
 def set_children_parent_and_keep_mx(children: list[Object], parent: Object) -> None:
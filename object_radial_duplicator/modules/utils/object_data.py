@@ -1,7 +1,7 @@
 from typing import Union
 
-import bpy
 import bmesh
+import bpy
 import numpy as np
 from bpy.types import Context
 from bpy.types import Curve
@@ -10,6 +10,12 @@ from bpy.types import Object
 from mathutils import Vector
 
 
+# rows of coordinates folded together for bounds reduction
+_BOUNDS_FOLD = 64
+# below this vertex count numpy call overhead outweighs the work
+_SMALL_MESH_VERT_COUNT = 32
+
+
 def get_mesh_selection_co_world(context: Context) -> Vector:
     """Get median coordinate of mesh selection."""
     bak_cursor_loc = context.scene.cursor.location.copy()
@@ -29,30 +35,56 @@ def data_is_selected(data: Union[Curve, Mesh]) -> bool:
 
 
 def mesh_is_selected(mesh: Mesh) -> bool:
-    """Check if mesh is selected."""
+    """Check if mesh is selected in edit mode."""
     bm = bmesh.from_edit_mesh(mesh)
-    return ('VERT' in bm.select_mode and next((v for v in bm.verts if v.select), False) or
-            'EDGE' in bm.select_mode and next((e for e in bm.edges if e.select), False) or
-            'FACE' in bm.select_mode and next((f for f in bm.faces if f.select), False))
+    select_mode = bm.select_mode
+    # Selected element totals are a fast positive check. They can lag behind edit mesh until it's updated,
+    # so elements are scanned when they read zero.
+    if ('VERT' in select_mode and mesh.total_vert_sel
+            or 'EDGE' in select_mode and mesh.total_edge_sel
+            or 'FACE' in select_mode and mesh.total_face_sel):
+        return True
+    return bool('VERT' in select_mode and any(v.select for v in bm.verts)
+                or 'EDGE' in select_mode and any(e.select for e in bm.edges)
+                or 'FACE' in select_mode and any(f.select for f in bm.faces))
 
 
 def curve_is_selected(curve: Curve) -> bool:
     """Check if curve is selected."""
-    splines = curve.splines
-    total_selection = []
-    for spline in splines:
+    # stop at the first spline with selected points instead of reading all of them
+    for spline in curve.splines:
         if spline.type == 'BEZIER':
-            points_count = len(spline.bezier_points)
-            selection = np.empty(points_count, "?")
-            spline.bezier_points.foreach_get("select_control_point", selection)
-            total_selection.append(selection)
+            points = spline.bezier_points
+            selection = np.empty(len(points), "?")
+            points.foreach_get("select_control_point", selection)
         else:
-            points_count = len(spline.points)
-            selection = np.empty(points_count, "?")
-            spline.points.foreach_get("select", selection)
-            total_selection.append(selection)
-    total_selection = np.array(total_selection).ravel()
-    return np.any(total_selection)
+            points = spline.points
+            selection = np.empty(len(points), "?")
+            points.foreach_get("select", selection)
+        if selection.any():
+            return True
+    return False
+
+
+def _get_bounds(co: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Get minimum and maximum of (n, 3) coordinates.
+
+    Reducing three columns runs as a slow strided loop, so rows are folded into wide rows first
+    and the partial results are reduced afterwards.
+    """
+    fold = _BOUNDS_FOLD
+    body_count = len(co) - len(co) % fold
+    if body_count == 0:
+        return np.amin(co, axis=0), np.amax(co, axis=0)
+
+    body = co[:body_count].reshape(-1, 3 * fold)
+    amin = np.amin(body, axis=0).reshape(fold, 3).min(axis=0)
+    amax = np.amax(body, axis=0).reshape(fold, 3).max(axis=0)
+    if body_count < len(co):
+        tail = co[body_count:]
+        np.minimum(amin, np.amin(tail, axis=0), out=amin)
+        np.maximum(amax, np.amax(tail, axis=0), out=amax)
+    return amin, amax
 
 
 def get_data_center_co_world(ob: Object) -> Vector:
@@ -64,23 +96,35 @@ def get_data_center_co_world(ob: Object) -> Vector:
         return get_curve_center_co_world(ob)
 
 
-def get_mesh_center_co_world(ob: Object) -> Vector:
-    """Get world space coordinates of mesh center."""
+def get_mesh_center_co_local(ob: Object) -> Vector:
+    """Get object space coordinates of mesh center."""
     me = ob.data
     verts = me.vertices
     vert_count = len(verts)
-    if vert_count > 0:
+    if vert_count == 0:
+        center_co = Vector((0, 0, 0))
+    elif vert_count < _SMALL_MESH_VERT_COUNT:
+        vert_co_local = [0.0] * (vert_count * 3)
+        verts.foreach_get("co", vert_co_local)
+        xs = vert_co_local[0::3]
+        ys = vert_co_local[1::3]
+        zs = vert_co_local[2::3]
+
+        center_co = Vector(((min(xs) + max(xs)) / 2, (min(ys) + max(ys)) / 2, (min(zs) + max(zs)) / 2))
+    else:
         vert_co_local = np.empty(vert_count * 3, "f")
         verts.foreach_get("co", vert_co_local)
         vert_co_local.shape = (vert_count, 3)
 
-        amax = np.amax(vert_co_local, axis=0)
-        amin = np.amin(vert_co_local, axis=0)
+        amin, amax = _get_bounds(vert_co_local)
 
-        center_co_local = (amax + amin) / 2
-        center_co = ob.matrix_world @ Vector(center_co_local)
-    else:
-        center_co = ob.matrix_world.to_translation()
+        center_co = Vector((amax + amin) / 2)
+    return center_co
+
+
+def get_mesh_center_co_world(ob: Object) -> Vector:
+    """Get world space coordinates of mesh center."""
+    center_co = ob.matrix_world @ get_mesh_center_co_local(ob)
     return center_co
 
 
@@ -88,35 +132,27 @@ def get_curve_center_co_world(ob: Object) -> Vector:
     """Get world space coordinates of curve center."""
     curve = ob.data
     splines = curve.splines
-    # Point coordinates
-    points_co = []
-    for spline in splines:
-        if spline.type == 'BEZIER':
-            points_count = len(spline.bezier_points)
-            co = np.empty(points_count * 3, "f")
-            spline.bezier_points.foreach_get("co", co)
-            co.shape = (points_count, 3)
-            points_co.append(co)
-        elif spline.type == 'NURBS':
-            points_count = len(spline.points)
+    # Points of each spline are read straight into their rows of one buffer.
+    spline_points = [
+        (True, spline.bezier_points) if spline.type == 'BEZIER' else (False, spline.points) for spline in splines
+    ]
+    points_co = np.empty((sum(len(points) for _, points in spline_points), 3), "f")
+    start = 0
+    for is_bezier, points in spline_points:
+        points_count = len(points)
+        end = start + points_count
+        if is_bezier:
+            points.foreach_get("co", points_co[start:end].reshape(-1))
+        else:
+            # spline points have homogeneous coordinates, drop the weight column
             co = np.empty(points_count * 4, "f")
-            spline.points.foreach_get("co", co)
+            points.foreach_get("co", co)
             co.shape = (points_count, 4)
-            co = co[:3]
-            points_co.append(co)
-        else:
-            points_count = len(spline.points)
-            co = np.empty(points_count * 3, "f")
-            spline.points.foreach_get("co", co)
-            co.shape = (points_count, 3)
-            points_co.append(co)
-    points_co = np.array(points_co).ravel()
+            points_co[start:end] = co[:, :3]
+        start = end
     # Median coordinate
     if points_co.size > 0:
-        points_co.shape = (-1, 3)
-
-        amax = np.amax(points_co, axis=0)
-        amin = np.amin(points_co, axis=0)
+        amin, amax = _get_bounds(points_co)
 
         center_co_local = (amax + amin) / 2
         center_co = ob.matrix_world @ Vector(center_co_local)
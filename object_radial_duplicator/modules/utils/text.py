@@ -1,73 +1,155 @@
 import blf
-from typing import TypeVar, Union, Any
+from functools import lru_cache
+from typing import NamedTuple, TypeVar, Union, Any
+
+from .view3d import get_non_overlap_width
 
 LEFT = TypeVar('LEFT')
 RIGHT = TypeVar('RIGHT')
 
+# line height by font id, font size and dpi
+_M_HEIGHT_CACHE: dict[tuple[int, int, int], float] = {}
+
+
+def _get_m_height(font_id: int, font_size: int, dpi: int) -> float:
+    """Get height of "M" glyph, used as line height, with font size already set."""
+    key = (font_id, font_size, dpi)
+    m_height = _M_HEIGHT_CACHE.get(key)
+    if m_height is None:
+        m_height = _M_HEIGHT_CACHE[key] = blf.dimensions(font_id, "M")[1]
+    return m_height
+
+
+@lru_cache(maxsize=4096)
+def _get_text_width(font_id: int, font_size: int, dpi: int, text: str) -> float:
+    """Get width of text with font size already set.
+
+    Labels and values repeat between redraws, so widths are cached. Texts are measured whole,
+    since kerning makes their width differ from the sum of glyph widths.
+    """
+    return blf.dimensions(font_id, text)[0]
+
+
+def _merge_color_runs(text_line: list[tuple[str, Any]]) -> list[tuple[str, Any]]:
+    """Join neighbour text fragments of the same color, so each run is drawn with one call."""
+    merged_line = []
+    for text, color in text_line:
+        if merged_line and merged_line[-1][1] == color:
+            merged_line[-1] = (merged_line[-1][0] + text, color)
+        else:
+            merged_line.append((text, color))
+    return merged_line
 
-def get_text_block_dimensions(text_lines: list[list[tuple[str, Any]]],
-                              line_padding: int,
-                              font_id: int,
-                              font_size: int,
-                              dpi: int):
-    """Get dimensions of text lines."""
+
+class TextBlock(NamedTuple):
+    """Text lines measured for drawing.
+
+    Text runs of all lines are stored in flat parallel lists, line_ends holds the index where runs of each line end.
+    """
+    texts: list[str]
+    colors: list[Any]
+    text_widths: list[float]
+    line_ends: list[int]
+    line_widths: list[float]
+    line_height: float
+    width: float
+    height: float
+
+
+def measure_text_block(text_lines: list[list[tuple[str, Any]]],
+                       line_padding: int,
+                       font_id: int,
+                       font_size: int,
+                       dpi: int) -> TextBlock:
+    """Measure text lines once for placing and drawing them."""
     blf.size(font_id, font_size)
 
-    text_block_height = (blf.dimensions(font_id, "M")[1]
+    line_height = _get_m_height(font_id, font_size, dpi)
+    text_block_height = (line_height
                          * (2 * len(text_lines) - 1)
                          + (len(text_lines) - 1) * line_padding)
+    texts = []
+    colors = []
+    text_widths = []
+    line_ends = []
+    line_widths = []  # summed once here, drawing of right aligned lines reuses them
     text_block_width = 0
     for text_line in text_lines:
-        text_line_width = sum([blf.dimensions(font_id, text)[0] for text, _ in text_line])
-        text_block_width = max(text_block_width, text_line_width)
+        line_width = 0
+        for text, color in _merge_color_runs(text_line):
+            text_width = _get_text_width(font_id, font_size, dpi, text)
+            texts.append(text)
+            colors.append(color)
+            text_widths.append(text_width)
+            line_width += text_width
+        line_ends.append(len(texts))
+        line_widths.append(line_width)
+        if line_width > text_block_width:
+            text_block_width = line_width
 
-    return text_block_width, text_block_height
+    return TextBlock(texts,
+                     colors,
+                     text_widths,
+                     line_ends,
+                     line_widths,
+                     line_height,
+                     text_block_width,
+                     text_block_height)
 
 
-def draw_text_block(text_lines: list[list[tuple[str, Any]]],
+def draw_text_block(text_block: TextBlock,
                     align_x: int,
                     top_y: int,
                     line_padding: int,
                     align: Union[LEFT, RIGHT],
                     font_id: int = 0,
                     font_size: int = 12,
-                    dpi: int = 0):
-    """Draw text lines from right top to bottom."""
-    blf.size(font_id, font_size)
-    blf.enable(font_id, blf.SHADOW)
-    blf.shadow_offset(font_id, 1, -1)
-    blf.shadow(font_id, 3, *(0, 0, 0, 1))
+                    set_font_state: bool = True):
+    """Draw measured text lines from right top to bottom.
 
-    text_height = blf.dimensions(font_id, "M")[1] * 2 + line_padding
-    text_y = top_y - blf.dimensions(font_id, "M")[1]
+    :param set_font_state: Set font size and shadow, can be skipped when previous text block was drawn
+        with the same font in the same draw callback.
+    """
+    if set_font_state:
+        blf.size(font_id, font_size)
+        blf.enable(font_id, blf.SHADOW)
+        blf.shadow_offset(font_id, 1, -1)
+        blf.shadow(font_id, 3, 0, 0, 0, 1)
 
-    for text_line in text_lines:
-        text_x = align_x
+    text_height = text_block.line_height * 2 + line_padding
+    text_y = top_y - text_block.line_height
+
+    align_right = align == 'RIGHT'
+    # bound once, looked up per text run otherwise
+    blf_color = blf.color
+    blf_position = blf.position
+    blf_draw = blf.draw
+
+    texts = text_block.texts
+    colors = text_block.colors
+    text_widths = text_block.text_widths
 
-        if align == 'RIGHT':
-            text_line = reversed(text_line)
+    last_color = None
+    line_start = 0
+    for line_end, line_width in zip(text_block.line_ends, text_block.line_widths):
+        # right aligned line is drawn left to right from its start
+        text_x = align_x - line_width if align_right else align_x
 
-        for text, color in text_line:
-            blf.color(font_id, *color)
-            text_width = blf.dimensions(font_id, text)[0]
+        for i in range(line_start, line_end):
+            # runs on neighbour lines often share color
+            color = colors[i]
+            if color != last_color:
+                blf_color(font_id, *color)
+                last_color = color
 
-            if align == 'RIGHT':
-                blf.position(font_id, text_x - text_width, text_y, 0)
-                blf.draw(font_id, text)
-                text_x -= text_width
-            else:
-                blf.position(font_id, text_x, text_y, 0)
-                blf.draw(font_id, text)
-                text_x += text_width
+            blf_position(font_id, text_x, text_y, 0)
+            blf_draw(font_id, texts[i])
+            text_x += text_widths[i]
 
+        line_start = line_end
         text_y -= text_height
 
 
 def get_region_width(context):
     """Width of region that doesn't overlap with sidebar."""
-    region_overlap = context.preferences.system.use_region_overlap
-    sidebar_width = next((region.width for region in context.area.regions if region.type == 'UI'), 0)
-    if context.space_data.show_region_ui and region_overlap:
-        return context.region.width - sidebar_width
-    else:
-        return context.region.width
+    return get_non_overlap_width(context)
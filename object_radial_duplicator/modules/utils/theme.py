@@ -1,9 +1,15 @@
+# theme attribute of axis color
+_AXIS_COLOR_ATTRS = {'X': 'axis_x', 'Y': 'axis_y', 'Z': 'axis_z'}
+
+# rgba axis colors by theme rgb, keyed by value so theme edits are picked up
+_AXIS_COLOR_CACHE: dict[tuple[float, float, float], tuple[float, float, float, float]] = {}
+
+
 def get_axis_color(context, spin_axis):
     """Get axis colors from blender theme."""
-    theme = context.preferences.themes[0]
-    axis_color = {
-        'X': lambda: (*theme.user_interface.axis_x, 1),
-        'Y': lambda: (*theme.user_interface.axis_y, 1),
-        'Z': lambda: (*theme.user_interface.axis_z, 1),
-    }[spin_axis]()
-    return axis_color
+    user_interface = context.preferences.themes[0].user_interface
+    rgb = tuple(getattr(user_interface, _AXIS_COLOR_ATTRS[spin_axis]))
+    rgba = _AXIS_COLOR_CACHE.get(rgb)
+    if rgba is None:
+        rgba = _AXIS_COLOR_CACHE[rgb] = (*rgb, 1)
+    return rgba
@@ -1,26 +1,50 @@
 from ...package import get_preferences
 
+# index of sidebar region by area pointer
+_UI_REGION_INDEX_CACHE: dict[int, int] = {}
+
 
 def hide_sidebar(context):
     if get_preferences().hide_sidebar:
-        if context.space_data.show_region_ui and context.preferences.system.use_region_overlap:
-            context.space_data.show_region_ui = False
+        space_data = context.space_data
+        if space_data.show_region_ui and context.preferences.system.use_region_overlap:
+            space_data.show_region_ui = False
 
 
 def restore_sidebar(context, initial_state):
     if get_preferences().hide_sidebar:
-        context.space_data.show_region_ui = initial_state
+        space_data = context.space_data
+        # writing the property tags area for redraw even if value is the same
+        if space_data.show_region_ui != initial_state:
+            space_data.show_region_ui = initial_state
+
+
+def _get_ui_region(area):
+    """Get sidebar region of area, reusing its index from previous lookups."""
+    regions = area.regions
+    area_pointer = area.as_pointer()
+    index = _UI_REGION_INDEX_CACHE.get(area_pointer)
+    # index is verified on hit, so a changed layout or reused pointer only costs a rescan
+    if index is not None and index < len(regions):
+        region = regions[index]
+        if region.type == 'UI':
+            return region
+
+    for index, region in enumerate(regions):
+        if region.type == 'UI':
+            _UI_REGION_INDEX_CACHE[area_pointer] = index
+            return region
+    return None
 
 
 def get_non_overlap_width(context):
     """Get width of ui that doesn't overlap width sidebar"""
-    region_overlap = context.preferences.system.use_region_overlap
     offset_width = 0
-    if context.space_data.show_region_ui and region_overlap:
-        for region in context.area.regions:
-            if region.type == 'UI':
-                offset_width = region.width  # area of 3d view covered by sidebar
-                break
+    # check cheap sidebar flag first, scan regions only when sidebar overlaps
+    if context.space_data.show_region_ui and context.preferences.system.use_region_overlap:
+        region = _get_ui_region(context.area)
+        if region is not None:
+            offset_width = region.width  # area of 3d view covered by sidebar
 
     safe_x = context.region.width - offset_width
     return safe_x